@@ -4,7 +4,7 @@ import tomllib
 from pathlib import Path
 from typing import Any, Optional, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from xdg_base_dirs import xdg_config_home
 from returns.result import Result, Failure, safe, Success
 
@@ -14,6 +14,8 @@ from cryoflow_core.result import bind_safe
 class PluginConfig(BaseModel):
     """Configuration for a single plugin."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     module: str
     enabled: bool = True
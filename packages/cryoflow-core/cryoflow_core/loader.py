@@ -30,15 +30,19 @@ def _resolve_module_path(module_str: str, config_dir: Path) -> Path:
     Relative paths are resolved relative to config_dir.
 
     Raises:
-        PluginLoadError: If the resolved path does not exist.
+        PluginLoadError: If the path does not exist or cannot be resolved.
     """
     path = Path(module_str)
     if not path.is_absolute():
         path = config_dir / path
-    resolved = path.resolve()
-    if not resolved.exists():
-        raise PluginLoadError(f'Plugin file does not exist: {resolved}')
-    return resolved
+    # strict resolution checks existence while walking the path, instead of a separate stat
+    try:
+        return path.resolve(strict=True)
+    except FileNotFoundError as e:
+        raise PluginLoadError(f'Plugin file does not exist: {path}') from e
+    except (OSError, RuntimeError) as e:
+        # RuntimeError: symlink loop on Python < 3.13
+        raise PluginLoadError(f'Failed to resolve plugin file {path}: {e}') from e
 
 
 def _load_module_from_path(name: str, path: Path) -> Any:
@@ -5,13 +5,12 @@ import logging
 import polars as pl
 from returns.result import Result, Success, Failure, safe  # noqa: F401
 
-from cryoflow_core.plugin import FrameData, InputPlugin, OutputPlugin, TransformPlugin
+from cryoflow_core.plugin import DEFAULT_LABEL, FrameData, InputPlugin, OutputPlugin, TransformPlugin
 
 logger = logging.getLogger(__name__)
 
-# Type aliases for label-aware data maps
+# Type alias for label-aware data maps
 LabeledDataMap = dict[str, Result[FrameData, Exception]]
-LabeledSchemaMap = dict[str, Result[dict[str, pl.DataType], Exception]]
 
 
 @safe
@@ -227,12 +226,12 @@ def run_dry_run_pipeline(
     Returns:
         Final output schema on success or Exception on failure.
     """
-    # Step 1: Build label-keyed schema map from InputPlugin.dry_run()
-    schema_map: LabeledSchemaMap = {}
-    for plugin in input_plugins:
-        schema_map[plugin.label] = plugin.dry_run()
-
-    # For single-label (default) case, delegate to existing chain helpers
-    default_schema = schema_map.get('default', Failure(KeyError("No input plugin with label 'default'")))
-    transformed_schema = execute_dry_run_chain(default_schema, transform_plugins)
+    # Step 1: Only the default label's schema is validated, and the last input plugin with that label
+    # wins (as in a label-keyed map), so other inputs' dry_run() results would be discarded unread
+    default_inputs = [plugin for plugin in input_plugins if plugin.label == DEFAULT_LABEL]
+    if not default_inputs:
+        return Failure(KeyError(f"No input plugin with label '{DEFAULT_LABEL}'"))
+
+    # Step 2/3: Each stage binds on the previous Result, so the first Failure skips the rest
+    transformed_schema = execute_dry_run_chain(default_inputs[-1].dry_run(), transform_plugins)
     return execute_output_dry_run(transformed_schema, output_plugins)
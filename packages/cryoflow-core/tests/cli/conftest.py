@@ -0,0 +1,43 @@
+"""Shared fixtures for CLI tests."""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import pluggy
+import pytest
+from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
+
+GetPlugins = Callable[[Any, type], list[Any]]
+MakeGetPlugins = Callable[..., GetPlugins]
+
+# Stand-in plugin for get_plugins stubs; the commands only count plugins before the (mocked) pipeline runs
+PLUGIN_SENTINEL = object()
+
+
+@pytest.fixture(scope='session')
+def shared_pm() -> pluggy.PluginManager:
+    """Return one plugin manager for load_plugins stand-ins; the CLI tests never inspect it."""
+    return pluggy.PluginManager('cryoflow')
+
+
+@pytest.fixture()
+def make_get_plugins() -> MakeGetPlugins:
+    """Return a factory for get_plugins stand-ins that serve fixed plugin lists per plugin type."""
+
+    def factory(
+        inputs: Sequence[Any] = (),
+        transforms: Sequence[Any] = (),
+        outputs: Sequence[Any] = (),
+    ) -> GetPlugins:
+        plugins_by_type: dict[type, Sequence[Any]] = {
+            InputPlugin: inputs,
+            TransformPlugin: transforms,
+            OutputPlugin: outputs,
+        }
+
+        def mock_get_plugins(_pm: Any, plugin_type: type) -> list[Any]:
+            return list(plugins_by_type.get(plugin_type, ()))
+
+        return mock_get_plugins
+
+    return factory
@@ -1,56 +1,48 @@
 """Tests for check command default config path handling."""
 
 from pathlib import Path
-from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pluggy
+import pytest
 from returns.result import Success
 from typer.testing import CliRunner
 
 from cryoflow_core.cli import app
+from cryoflow_core.commands import check as check_mod
 from cryoflow_core.config import CryoflowConfig
 
-from ..conftest import MINIMAL_TOML
+from ..conftest import NO_INPUT_PLUGIN_ERROR
+from .conftest import MakeGetPlugins
 
 runner = CliRunner()
 
 
 class TestCheckDefaultConfigPath:
-    def test_default_config_path_used(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(MINIMAL_TOML)
-
-        def mock_get_plugins(_pm: Any, plugin_type: Any) -> list[Any]:
-            from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
-
-            if plugin_type is InputPlugin:
-                return []
-            elif plugin_type is TransformPlugin:
-                return []
-            elif plugin_type is OutputPlugin:
-                return []
-            return []
-
-        with (
-            patch(
-                'cryoflow_core.commands.check.get_config_path',
-                return_value=config_file,
-            ) as mock_default,
-            patch('cryoflow_core.commands.check.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.check.get_plugins', side_effect=mock_get_plugins),
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            with patch('cryoflow_core.commands.check.load_config') as mock_load_config:
-                mock_load_config.return_value = Success(
-                    CryoflowConfig(
-                        input_plugins=[],
-                        transform_plugins=[],
-                        output_plugins=[],
-                    )
+    def test_default_config_path_used(
+        self,
+        minimal_config_file: Path,
+        shared_pm: pluggy.PluginManager,
+        make_get_plugins: MakeGetPlugins,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        mock_default = MagicMock(return_value=minimal_config_file)
+        monkeypatch.setattr(check_mod, 'get_config_path', mock_default)
+        monkeypatch.setattr(check_mod, 'load_plugins', lambda *_: shared_pm)
+        monkeypatch.setattr(check_mod, 'get_plugins', make_get_plugins())
+        monkeypatch.setattr(
+            check_mod,
+            'load_config',
+            lambda *_: Success(
+                CryoflowConfig(
+                    input_plugins=[],
+                    transform_plugins=[],
+                    output_plugins=[],
                 )
-                result = runner.invoke(app, ['check'])
+            ),
+        )
+        result = runner.invoke(app, ['check'])
 
-            mock_default.assert_called_once()
+        mock_default.assert_called_once()
         assert result.exit_code == 1
-        assert '[ERROR] No input plugin configured' in result.output
+        assert NO_INPUT_PLUGIN_ERROR in result.output
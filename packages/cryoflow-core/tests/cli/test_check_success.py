@@ -2,107 +2,72 @@
 
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
 
 import pluggy
 import polars as pl
+import pytest
+import typer
 from returns.result import Success
 from typer.testing import CliRunner
 
 from cryoflow_core.cli import app
+from cryoflow_core.commands import check as check_mod
+from cryoflow_core.loader import PluginLoadError
 
-from ..conftest import VALID_TOML
+from ..conftest import VALIDATION_SUCCESS
+from .conftest import PLUGIN_SENTINEL, MakeGetPlugins
 
 runner = CliRunner()
 
 
 class TestCheckSuccess:
-    def test_check_config_loaded_message(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
-
-        with patch('cryoflow_core.commands.check.load_plugins') as mock_load:
-            from cryoflow_core.loader import PluginLoadError
-            mock_load.side_effect = PluginLoadError('no real plugin')
-            result = runner.invoke(app, ['check', '--config', str(config_file)])
-
-        assert '[CHECK] Config loaded:' in result.output
-
-    def test_check_plugin_count_message(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
-
-        def mock_get_plugins(_pm: Any, plugin_type: Any) -> list[Any]:
-            from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
-
-            if plugin_type is InputPlugin:
-                return []
-            elif plugin_type is TransformPlugin:
-                return []
-            elif plugin_type is OutputPlugin:
-                return []
-            return []
-
-        with (
-            patch('cryoflow_core.commands.check.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.check.get_plugins', side_effect=mock_get_plugins),
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            result = runner.invoke(app, ['check', '--config', str(config_file)])
+    def test_check_config_loaded_message(
+        self, valid_config_file: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        def mock_load_plugins(*_: Any) -> pluggy.PluginManager:
+            raise PluginLoadError('no real plugin')
+
+        monkeypatch.setattr(check_mod, 'load_plugins', mock_load_plugins)
+        with pytest.raises(typer.Exit):
+            check_mod.execute(valid_config_file)
+        output = capsys.readouterr().out
+
+        assert '[CHECK] Config loaded:' in output
+
+    def test_check_plugin_count_message(
+        self,
+        valid_config_file: Path,
+        shared_pm: pluggy.PluginManager,
+        make_get_plugins: MakeGetPlugins,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        monkeypatch.setattr(check_mod, 'load_plugins', lambda *_: shared_pm)
+        monkeypatch.setattr(check_mod, 'get_plugins', make_get_plugins())
+        with pytest.raises(typer.Exit):
+            check_mod.execute(valid_config_file)
+        output = capsys.readouterr().out
 
         # VALID_TOML has 1 input + 1 transform + 0 output = 2 enabled plugins
-        assert '[CHECK] Loaded 2 plugin(s) successfully.' in result.output
-
-    def test_check_dry_run_success(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
-
-        def mock_get_plugins(_pm: Any, plugin_type: Any) -> list[Any]:
-            from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
-
-            if plugin_type is InputPlugin:
-                return [MagicMock()]
-            elif plugin_type is TransformPlugin:
-                return []
-            elif plugin_type is OutputPlugin:
-                return [MagicMock()]
-            return []
-
-        with (
-            patch('cryoflow_core.commands.check.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.check.get_plugins', side_effect=mock_get_plugins),
-            patch('cryoflow_core.commands.check.run_dry_run_pipeline') as mock_dry_run,
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            mock_dry_run.return_value = Success({'col_a': pl.Int64, 'col_b': pl.String})
-            result = runner.invoke(app, ['check', '--config', str(config_file)])
+        assert '[CHECK] Loaded 2 plugin(s) successfully.' in output
+
+    def test_check_dry_run_success(
+        self,
+        valid_config_file: Path,
+        shared_pm: pluggy.PluginManager,
+        make_get_plugins: MakeGetPlugins,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(check_mod, 'load_plugins', lambda *_: shared_pm)
+        monkeypatch.setattr(
+            check_mod, 'get_plugins', make_get_plugins(inputs=[PLUGIN_SENTINEL], outputs=[PLUGIN_SENTINEL])
+        )
+        monkeypatch.setattr(
+            check_mod, 'run_dry_run_pipeline', lambda *_: Success({'col_a': pl.Int64, 'col_b': pl.String})
+        )
+        result = runner.invoke(app, ['check', '--config', str(valid_config_file)])
 
         assert result.exit_code == 0
-        assert '[SUCCESS] Validation completed successfully' in result.output
-
-    def test_check_outputs_schema(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
-
-        def mock_get_plugins(_pm: Any, plugin_type: Any) -> list[Any]:
-            from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
-
-            if plugin_type is InputPlugin:
-                return [MagicMock()]
-            elif plugin_type is TransformPlugin:
-                return []
-            elif plugin_type is OutputPlugin:
-                return [MagicMock()]
-            return []
-
-        with (
-            patch('cryoflow_core.commands.check.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.check.get_plugins', side_effect=mock_get_plugins),
-            patch('cryoflow_core.commands.check.run_dry_run_pipeline') as mock_dry_run,
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            mock_dry_run.return_value = Success({'col_a': pl.Int64, 'col_b': pl.String})
-            result = runner.invoke(app, ['check', '--config', str(config_file)])
-
+        assert VALIDATION_SUCCESS in result.output
         assert 'col_a' in result.output
         assert 'col_b' in result.output
@@ -1,5 +1,6 @@
 """Tests for CLI help display."""
 
+import pytest
 from typer.testing import CliRunner
 
 from cryoflow_core.cli import app
@@ -14,27 +15,18 @@ class TestHelpDisplay:
         assert result.exit_code in (0, 2)
         assert 'Usage' in result.output or 'usage' in result.output.lower()
 
-    def test_help_flag(self) -> None:
-        result = runner.invoke(app, ['--help'])
+    @pytest.mark.parametrize(
+        'args,expected',
+        [
+            (['--help'], 'Usage'),
+            (['-h'], 'Usage'),
+            (['run', '--help'], '--config'),
+            (['run', '-h'], '--config'),
+            (['check', '-h'], '--config'),
+        ],
+        ids=['help', 'help_short', 'run_help', 'run_help_short', 'check_help_short'],
+    )
+    def test_help(self, args: list[str], expected: str) -> None:
+        result = runner.invoke(app, args)
         assert result.exit_code == 0
-        assert 'Usage' in result.output
-
-    def test_help_short_flag(self) -> None:
-        result = runner.invoke(app, ['-h'])
-        assert result.exit_code == 0
-        assert 'Usage' in result.output
-
-    def test_run_help(self) -> None:
-        result = runner.invoke(app, ['run', '--help'])
-        assert result.exit_code == 0
-        assert '--config' in result.output
-
-    def test_run_help_short_flag(self) -> None:
-        result = runner.invoke(app, ['run', '-h'])
-        assert result.exit_code == 0
-        assert '--config' in result.output
-
-    def test_check_help_short_flag(self) -> None:
-        result = runner.invoke(app, ['check', '-h'])
-        assert result.exit_code == 0
-        assert '--config' in result.output
+        assert expected in result.output
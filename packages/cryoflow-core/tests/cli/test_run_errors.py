@@ -1,37 +1,35 @@
 """Tests for run command error cases."""
 
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
 
+import pluggy
+import pytest
 from typer.testing import CliRunner
 
 from cryoflow_core.cli import app
+from cryoflow_core.commands import run as run_mod
 from cryoflow_core.loader import PluginLoadError
 
-from ..conftest import VALID_TOML
-
 runner = CliRunner()
 
 
 class TestRunErrors:
-    def test_nonexistent_file(self, tmp_path: Path) -> None:
-        result = runner.invoke(app, ['run', '--config', str(tmp_path / 'nonexistent.toml')])
+    def test_nonexistent_file(self, valid_config_file: Path) -> None:
+        # The session config directory holds only config.toml, so a sibling name never exists
+        result = runner.invoke(app, ['run', '--config', str(valid_config_file.with_name('nonexistent.toml'))])
         assert result.exit_code != 0
 
-    def test_config_load_error(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'bad.toml'
-        config_file.write_text('invalid = [[[')
-
-        result = runner.invoke(app, ['run', '--config', str(config_file)])
+    def test_config_load_error(self, invalid_syntax_config_file: Path) -> None:
+        result = runner.invoke(app, ['run', '--config', str(invalid_syntax_config_file)])
         assert result.exit_code == 1
 
-    def test_plugin_load_error(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
+    def test_plugin_load_error(self, valid_config_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        def mock_load_plugins(*_: Any) -> pluggy.PluginManager:
+            raise PluginLoadError('plugin failed to load')
 
-        with patch('cryoflow_core.commands.run.load_plugins') as mock_load:
-            mock_load.side_effect = PluginLoadError('plugin failed to load')
-            result = runner.invoke(app, ['run', '--config', str(config_file)])
+        monkeypatch.setattr(run_mod, 'load_plugins', mock_load_plugins)
+        result = runner.invoke(app, ['run', '--config', str(valid_config_file)])
 
         assert result.exit_code == 1
         assert 'plugin failed to load' in result.output
@@ -1,128 +1,64 @@
 """Tests for run command success cases."""
 
 from pathlib import Path
-from typing import Any
-from unittest.mock import patch
 
 import pluggy
+import pytest
 from typer.testing import CliRunner
 
 from cryoflow_core.cli import app
+from cryoflow_core.commands import run as run_mod
 
-from ..conftest import MINIMAL_TOML, VALID_TOML
+from ..conftest import NO_INPUT_PLUGIN_ERROR, NO_OUTPUT_PLUGIN_ERROR
+from .conftest import PLUGIN_SENTINEL, MakeGetPlugins
 
 runner = CliRunner()
 
 
 class TestRunSuccess:
-    def test_run_with_valid_config_no_input(self, tmp_path: Path) -> None:
-        """Without input plugin mocked, command should report 'No input plugin configured'."""
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
-
-        def mock_get_plugins(_pm: Any, plugin_type: Any) -> list[Any]:
-            from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
-
-            if plugin_type is InputPlugin:
-                return []
-            elif plugin_type is TransformPlugin:
-                return []
-            elif plugin_type is OutputPlugin:
-                return []
-            return []
-
-        with (
-            patch('cryoflow_core.commands.run.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.run.get_plugins', side_effect=mock_get_plugins),
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            result = runner.invoke(app, ['run', '--config', str(config_file)])
-
-        assert result.exit_code == 1
-        assert '[ERROR] No input plugin configured' in result.output
-
-    def test_run_with_valid_config_no_output(self, tmp_path: Path) -> None:
-        """With input plugin but no output plugin, should report 'No output plugin configured'."""
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
-
-        def mock_get_plugins(_pm: Any, plugin_type: Any) -> list[Any]:
-            from unittest.mock import MagicMock
-
-            from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
-
-            if plugin_type is InputPlugin:
-                return [MagicMock()]
-            elif plugin_type is TransformPlugin:
-                return []
-            elif plugin_type is OutputPlugin:
-                return []
-            return []
-
-        with (
-            patch('cryoflow_core.commands.run.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.run.get_plugins', side_effect=mock_get_plugins),
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            result = runner.invoke(app, ['run', '--config', str(config_file)])
+    def test_run_with_valid_config_no_input(
+        self,
+        valid_config_file: Path,
+        shared_pm: pluggy.PluginManager,
+        make_get_plugins: MakeGetPlugins,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Without input plugin mocked, command should print the config summary, then report the missing input."""
+        monkeypatch.setattr(run_mod, 'load_plugins', lambda *_: shared_pm)
+        monkeypatch.setattr(run_mod, 'get_plugins', make_get_plugins())
+        result = runner.invoke(app, ['run', '--config', str(valid_config_file)])
 
         assert result.exit_code == 1
-        assert '[ERROR] No output plugin configured' in result.output
-
-    def test_output_contains_input_plugins(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
-
-        def mock_get_plugins(_pm: Any, _plugin_type: Any) -> list[Any]:
-            return []
-
-        with (
-            patch('cryoflow_core.commands.run.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.run.get_plugins', side_effect=mock_get_plugins),
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            result = runner.invoke(app, ['run', '--config', str(config_file)])
-
         assert 'input_plugins' in result.output
-
-    def test_output_contains_plugin_count(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(VALID_TOML)
-
-        def mock_get_plugins(_pm: Any, _plugin_type: Any) -> list[Any]:
-            return []
-
-        with (
-            patch('cryoflow_core.commands.run.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.run.get_plugins', side_effect=mock_get_plugins),
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            result = runner.invoke(app, ['run', '--config', str(config_file)])
-
         # VALID_TOML has 1 input + 1 transform + 0 output = 2 enabled plugins
         assert 'plugin(s)' in result.output
+        assert NO_INPUT_PLUGIN_ERROR in result.output
+
+    def test_run_with_valid_config_no_output(
+        self,
+        valid_config_file: Path,
+        shared_pm: pluggy.PluginManager,
+        make_get_plugins: MakeGetPlugins,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """With input plugin but no output plugin, should report 'No output plugin configured'."""
+        monkeypatch.setattr(run_mod, 'load_plugins', lambda *_: shared_pm)
+        monkeypatch.setattr(run_mod, 'get_plugins', make_get_plugins(inputs=[PLUGIN_SENTINEL]))
+        result = runner.invoke(app, ['run', '--config', str(valid_config_file)])
 
-    def test_minimal_config(self, tmp_path: Path) -> None:
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text(MINIMAL_TOML)
-
-        def mock_get_plugins(_pm: Any, plugin_type: Any) -> list[Any]:
-            from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
-
-            if plugin_type is InputPlugin:
-                return []
-            elif plugin_type is TransformPlugin:
-                return []
-            elif plugin_type is OutputPlugin:
-                return []
-            return []
-
-        with (
-            patch('cryoflow_core.commands.run.load_plugins') as mock_load,
-            patch('cryoflow_core.commands.run.get_plugins', side_effect=mock_get_plugins),
-        ):
-            mock_load.return_value = pluggy.PluginManager('cryoflow')
-            result = runner.invoke(app, ['run', '--config', str(config_file)])
+        assert result.exit_code == 1
+        assert NO_OUTPUT_PLUGIN_ERROR in result.output
+
+    def test_minimal_config(
+        self,
+        minimal_config_file: Path,
+        shared_pm: pluggy.PluginManager,
+        make_get_plugins: MakeGetPlugins,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(run_mod, 'load_plugins', lambda *_: shared_pm)
+        monkeypatch.setattr(run_mod, 'get_plugins', make_get_plugins())
+        result = runner.invoke(app, ['run', '--config', str(minimal_config_file)])
 
         assert result.exit_code == 1
-        assert '[ERROR] No input plugin configured' in result.output
+        assert NO_INPUT_PLUGIN_ERROR in result.output
@@ -1,5 +1,6 @@
 """Tests for CLI version display."""
 
+import pytest
 from typer.testing import CliRunner
 
 from cryoflow_core.cli import app
@@ -8,14 +9,9 @@ runner = CliRunner()
 
 
 class TestVersionDisplay:
-    def test_version_flag(self) -> None:
-        result = runner.invoke(app, ['--version'])
-        assert result.exit_code == 0
-        assert 'cryoflow version' in result.output
-        assert 'cryoflow-plugin-collections version' in result.output
-
-    def test_version_short_flag(self) -> None:
-        result = runner.invoke(app, ['-v'])
+    @pytest.mark.parametrize('flag', ['--version', '-v'])
+    def test_version(self, flag: str) -> None:
+        result = runner.invoke(app, [flag])
         assert result.exit_code == 0
         assert 'cryoflow version' in result.output
         assert 'cryoflow-plugin-collections version' in result.output
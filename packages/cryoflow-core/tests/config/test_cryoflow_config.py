@@ -17,26 +17,12 @@ class TestCryoflowConfig:
         assert len(cfg.transform_plugins) == 1
         assert len(cfg.output_plugins) == 0
 
-    def test_missing_input_plugins(self):
+    @pytest.mark.parametrize('omit', ['input_plugins', 'transform_plugins', 'output_plugins'])
+    def test_missing_field(self, omit: str):
+        kwargs: dict[str, list[PluginConfig]] = {'input_plugins': [], 'transform_plugins': [], 'output_plugins': []}
+        kwargs.pop(omit)
         with pytest.raises(ValidationError):
-            CryoflowConfig(
-                transform_plugins=[],
-                output_plugins=[],
-            )  # type: ignore[call-arg]
-
-    def test_missing_transform_plugins(self):
-        with pytest.raises(ValidationError):
-            CryoflowConfig(
-                input_plugins=[],
-                output_plugins=[],
-            )  # type: ignore[call-arg]
-
-    def test_missing_output_plugins(self):
-        with pytest.raises(ValidationError):
-            CryoflowConfig(
-                input_plugins=[],
-                transform_plugins=[],
-            )  # type: ignore[call-arg]
+            CryoflowConfig(**kwargs)  # type: ignore[call-arg]
 
     def test_empty_input_plugins(self):
         cfg = CryoflowConfig(
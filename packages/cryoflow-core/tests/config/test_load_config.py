@@ -2,10 +2,13 @@
 
 from pathlib import Path
 
-from returns.result import Failure, Success
+import pytest
+from returns.result import Success
 
 from cryoflow_core.config import load_config
 
+from ..conftest import assert_failure_contains
+
 
 class TestLoadConfig:
     def test_valid(self, valid_config_file):
@@ -29,27 +32,25 @@ class TestLoadConfig:
 
     def test_file_not_found(self, tmp_path: Path):
         result = load_config(tmp_path / 'nonexistent.toml')
-        assert isinstance(result, Failure)
-        assert 'Config file not found' in str(result.failure())
+        assert_failure_contains(result, 'Config file not found')
 
     def test_invalid_toml_syntax(self, invalid_syntax_config_file):
         result = load_config(invalid_syntax_config_file)
-        assert isinstance(result, Failure)
-        assert 'Failed to parse TOML' in str(result.failure())
+        assert_failure_contains(result, 'Failed to parse TOML')
 
     def test_validation_error(self, missing_fields_config_file):
         result = load_config(missing_fields_config_file)
-        assert isinstance(result, Failure)
-        assert 'Config validation failed' in str(result.failure())
+        assert_failure_contains(result, 'Config validation failed')
+
+    def test_read_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        def deny(self: Path) -> bytes:
+            raise PermissionError(f'Permission denied: {self}')
 
-    def test_read_error(self, tmp_path: Path):
         config_file = tmp_path / 'unreadable.toml'
         config_file.write_text('dummy')
-        config_file.chmod(0o000)
+        monkeypatch.setattr(Path, 'read_bytes', deny)
         result = load_config(config_file)
-        assert isinstance(result, Failure)
-        assert 'Failed to read config file' in str(result.failure())
-        config_file.chmod(0o644)  # restore for cleanup
+        assert_failure_contains(result, 'Failed to read config file')
 
     def test_multi_plugin(self, multi_plugin_config_file):
         result = load_config(multi_plugin_config_file)
@@ -42,3 +42,8 @@ class TestPluginConfig:
     def test_missing_module(self):
         with pytest.raises(ValidationError):
             PluginConfig(name='p')  # type: ignore[call-arg]
+
+    def test_frozen(self):
+        pc = PluginConfig(name='p', module='m')
+        with pytest.raises(ValidationError):
+            pc.enabled = False  # type: ignore[misc]
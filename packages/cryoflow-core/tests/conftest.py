@@ -3,10 +3,12 @@
 from pathlib import Path
 from typing import Any
 
+import pluggy
 import polars as pl
 import pytest
-from returns.result import Failure, Success
+from returns.result import Failure, Result, Success
 
+from cryoflow_core.hookspecs import CryoflowSpecs
 from cryoflow_core.plugin import (
     DEFAULT_LABEL,
     FrameData,
@@ -15,6 +17,21 @@ from cryoflow_core.plugin import (
     TransformPlugin,
 )
 
+# Config directory for plugins whose test never touches the filesystem; avoids creating a tmp_path per test
+UNUSED_CONFIG_DIR = Path('config_dir')
+
+
+def assert_failure_contains(result: Result[Any, Exception], substr: str) -> Exception:
+    """Assert that result is a Failure whose exception message contains substr.
+
+    Returns:
+        The wrapped exception, for further checks by the caller.
+    """
+    assert isinstance(result, Failure)
+    exc = result.failure()
+    assert substr in str(exc)
+    return exc
+
 
 # ---------------------------------------------------------------------------
 # Concrete plugin classes for testing (ABC cannot be instantiated directly)
@@ -60,8 +77,24 @@ class DummyOutputPlugin(OutputPlugin):
         return Success(schema)
 
 
+class FailingInputPlugin(InputPlugin):
+    """Input plugin whose source is always missing."""
+
+    def name(self) -> str:
+        return 'failing_input'
+
+    def execute(self) -> Failure[Exception]:
+        return Failure(FileNotFoundError('file not found'))
+
+    def dry_run(self) -> Failure[Exception]:
+        return Failure(FileNotFoundError('file not found'))
+
+
 class FailingTransformPlugin(TransformPlugin):
-    """Transform plugin that always fails."""
+    """Transform plugin that always fails.
+
+    The dry-run error message can be overridden with the 'dry_run_error' option.
+    """
 
     def name(self) -> str:
         return 'failing_transform'
@@ -70,7 +103,23 @@ class FailingTransformPlugin(TransformPlugin):
         return Failure(ValueError('intentional failure'))
 
     def dry_run(self, schema: dict[str, pl.DataType]) -> Failure[Exception]:
-        return Failure(ValueError('intentional dry_run failure'))
+        return Failure(ValueError(self.options.get('dry_run_error', 'intentional dry_run failure')))
+
+
+class FailingOutputPlugin(OutputPlugin):
+    """Output plugin that always fails.
+
+    The dry-run error message can be overridden with the 'dry_run_error' option.
+    """
+
+    def name(self) -> str:
+        return 'failing_output'
+
+    def execute(self, df: FrameData) -> Failure[Exception]:
+        return Failure(ValueError('intentional failure'))
+
+    def dry_run(self, schema: dict[str, pl.DataType]) -> Failure[Exception]:
+        return Failure(ValueError(self.options.get('dry_run_error', 'intentional dry_run failure')))
 
 
 class BrokenInitPlugin(TransformPlugin):
@@ -89,6 +138,15 @@ class BrokenInitPlugin(TransformPlugin):
         return Success(schema)
 
 
+# ---------------------------------------------------------------------------
+# CLI message constants
+# ---------------------------------------------------------------------------
+
+NO_INPUT_PLUGIN_ERROR = '[ERROR] No input plugin configured'
+NO_OUTPUT_PLUGIN_ERROR = '[ERROR] No output plugin configured'
+VALIDATION_SUCCESS = '[SUCCESS] Validation completed successfully'
+
+
 # ---------------------------------------------------------------------------
 # TOML string constants
 # ---------------------------------------------------------------------------
@@ -149,46 +207,59 @@ key = "value"
 """
 
 # ---------------------------------------------------------------------------
-# Config file fixtures
+# PluginManager fixtures
 # ---------------------------------------------------------------------------
 
 
 @pytest.fixture()
-def valid_config_file(tmp_path: Path) -> Path:
-    """Create a temporary valid TOML config file."""
-    p = tmp_path / 'config.toml'
+def fresh_pm() -> pluggy.PluginManager:
+    """Return a new PluginManager with CryoflowSpecs already registered."""
+    pm = pluggy.PluginManager('cryoflow')
+    pm.add_hookspecs(CryoflowSpecs)
+    return pm
+
+
+# ---------------------------------------------------------------------------
+# Config file fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope='session')
+def valid_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a valid TOML config file once per session (tests must not modify it)."""
+    p = tmp_path_factory.mktemp('cfg') / 'config.toml'
     p.write_text(VALID_TOML)
     return p
 
 
-@pytest.fixture()
-def minimal_config_file(tmp_path: Path) -> Path:
-    """Create a temporary minimal TOML config file."""
-    p = tmp_path / 'config.toml'
+@pytest.fixture(scope='session')
+def minimal_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a minimal TOML config file once per session (tests must not modify it)."""
+    p = tmp_path_factory.mktemp('cfg') / 'config.toml'
     p.write_text(MINIMAL_TOML)
     return p
 
 
-@pytest.fixture()
-def invalid_syntax_config_file(tmp_path: Path) -> Path:
-    """Create a temporary TOML config file with syntax errors."""
-    p = tmp_path / 'config.toml'
+@pytest.fixture(scope='session')
+def invalid_syntax_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a TOML config file with syntax errors once per session (tests must not modify it)."""
+    p = tmp_path_factory.mktemp('cfg') / 'config.toml'
     p.write_text(INVALID_TOML_SYNTAX)
     return p
 
 
-@pytest.fixture()
-def missing_fields_config_file(tmp_path: Path) -> Path:
-    """Create a temporary TOML config file with missing required fields."""
-    p = tmp_path / 'config.toml'
+@pytest.fixture(scope='session')
+def missing_fields_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a TOML config file with missing required fields once per session (tests must not modify it)."""
+    p = tmp_path_factory.mktemp('cfg') / 'config.toml'
     p.write_text(MISSING_FIELDS_TOML)
     return p
 
 
-@pytest.fixture()
-def multi_plugin_config_file(tmp_path: Path) -> Path:
-    """Create a temporary TOML config file with multiple plugins."""
-    p = tmp_path / 'config.toml'
+@pytest.fixture(scope='session')
+def multi_plugin_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a TOML config file with multiple plugins once per session (tests must not modify it)."""
+    p = tmp_path_factory.mktemp('cfg') / 'config.toml'
     p.write_text(MULTI_PLUGIN_TOML)
     return p
 
@@ -198,13 +269,42 @@ def multi_plugin_config_file(tmp_path: Path) -> Path:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def sample_lazyframe() -> pl.LazyFrame:
-    """Return a sample Polars LazyFrame."""
+    """Return a sample Polars LazyFrame (shared across the session; LazyFrames are immutable)."""
     return pl.LazyFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def sample_dataframe() -> pl.DataFrame:
-    """Return a sample Polars DataFrame."""
+    """Return a sample Polars DataFrame (shared across the session; tests must not modify it in place)."""
     return pl.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+
+
+# ---------------------------------------------------------------------------
+# Plugin instance fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope='session')
+def dummy_input() -> DummyInputPlugin:
+    """Return a shared DummyInputPlugin with default options (tests must not mutate it)."""
+    return DummyInputPlugin({}, UNUSED_CONFIG_DIR)
+
+
+@pytest.fixture(scope='session')
+def dummy_transform() -> DummyTransformPlugin:
+    """Return a shared DummyTransformPlugin with default options (tests must not mutate it)."""
+    return DummyTransformPlugin({}, UNUSED_CONFIG_DIR)
+
+
+@pytest.fixture(scope='session')
+def failing_transform() -> FailingTransformPlugin:
+    """Return a shared FailingTransformPlugin with default options (tests must not mutate it)."""
+    return FailingTransformPlugin({}, UNUSED_CONFIG_DIR)
+
+
+@pytest.fixture(scope='session')
+def dummy_output() -> DummyOutputPlugin:
+    """Return a shared DummyOutputPlugin with default options (tests must not mutate it)."""
+    return DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
@@ -0,0 +1,113 @@
+"""Fixtures shared by end-to-end tests."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pluggy
+import polars as pl
+import pytest
+from cryoflow_core.config import load_config
+from cryoflow_core.loader import load_plugins
+
+SHARED_CONFIG_TEMPLATE = """\
+[[input_plugins]]
+name = "parquet_scan"
+module = "cryoflow_plugin_collections.input.parquet_scan"
+enabled = true
+
+[input_plugins.options]
+input_path = "{input_file}"
+
+[[transform_plugins]]
+name = "column_multiplier"
+module = "cryoflow_plugin_collections.transform.multiplier"
+enabled = true
+
+[transform_plugins.options]
+column_name = "amount"
+multiplier = 2
+
+[[output_plugins]]
+name = "parquet_writer"
+module = "cryoflow_plugin_collections.output.parquet_writer"
+enabled = true
+
+[output_plugins.options]
+output_path = "{output_file}"
+"""
+
+SHARED_INPUT_DATA: dict[str, list[int] | list[str]] = {
+    'amount': [100, 200, 300],
+    'item': ['a', 'b', 'c'],
+}
+
+SHARED_IPC_DATA: dict[str, list[int] | list[str]] = {
+    'value': [10, 20, 30],
+    'name': ['x', 'y', 'z'],
+}
+
+# Opt-in switch for persisting session artifacts across local runs (not used on CI)
+TEST_CACHE_ENV = 'CRYOFLOW_TEST_CACHE'
+
+
+def _shared_input_digest() -> str:
+    """Return a stable content hash of SHARED_INPUT_DATA (builtin hash() is salted per process)."""
+    return hashlib.sha256(repr(sorted(SHARED_INPUT_DATA.items())).encode()).hexdigest()[:16]
+
+
+@pytest.fixture(scope='session')
+def shared_input_parquet(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the canonical e2e input Parquet file once per session.
+
+    When CRYOFLOW_TEST_CACHE is set, the file is stored in the pytest cache
+    directory keyed by its content hash and reused by subsequent runs.
+    """
+    cache: pytest.Cache | None = getattr(request.config, 'cache', None)
+    if cache is None or not os.environ.get(TEST_CACHE_ENV):
+        input_file = tmp_path_factory.mktemp('e2e_shared') / 'input.parquet'
+        pl.DataFrame(SHARED_INPUT_DATA).write_parquet(input_file)
+        return input_file
+
+    digest = _shared_input_digest()
+    key = f'cryoflow/parquet/{digest}'
+    cached = cache.get(key, None)
+    if cached is not None and Path(cached).exists():
+        return Path(cached)
+
+    input_file = cache.mkdir(f'cryoflow-parquet-{digest}') / 'input.parquet'
+    # Write under a per-process name and rename, so parallel pytest-xdist workers never read a partial file
+    partial_file = input_file.with_name(f'{input_file.name}.{os.getpid()}.tmp')
+    pl.DataFrame(SHARED_INPUT_DATA).write_parquet(partial_file)
+    os.replace(partial_file, input_file)
+    cache.set(key, str(input_file))
+    return input_file
+
+
+@pytest.fixture(scope='session')
+def shared_input_ipc(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the e2e IPC input file once per session (uncompressed; the reader is not under test)."""
+    input_file = tmp_path_factory.mktemp('e2e_shared_ipc') / 'input.ipc'
+    pl.DataFrame(SHARED_IPC_DATA).write_ipc(input_file)
+    return input_file
+
+
+@pytest.fixture(scope='session')
+def shared_config_file(shared_input_parquet: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a parquet_scan -> column_multiplier -> parquet_writer config reading the shared input."""
+    config_dir = tmp_path_factory.mktemp('e2e_config')
+    config_file = config_dir / 'config.toml'
+    config_file.write_text(
+        SHARED_CONFIG_TEMPLATE.format(
+            input_file=shared_input_parquet,
+            output_file=config_dir / 'output.parquet',
+        )
+    )
+    return config_file
+
+
+@pytest.fixture(scope='session')
+def shared_plugin_manager(shared_config_file: Path) -> pluggy.PluginManager:
+    """Load the plugins of the shared config once and reuse the PluginManager."""
+    cfg = load_config(shared_config_file).unwrap()
+    return load_plugins(cfg, shared_config_file)
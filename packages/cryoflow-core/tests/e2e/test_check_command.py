@@ -1,66 +1,32 @@
 """End-to-end tests for the 'check' CLI command."""
 
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
-import polars as pl
+import pluggy
+import pytest
 from typer.testing import CliRunner
 
 from cryoflow_core.cli import app
+from cryoflow_core.commands import check as check_mod
+
+from ..conftest import VALIDATION_SUCCESS
 
 
 class TestCheckCommand:
     """Tests for the 'check' command CLI."""
 
-    def test_check_command_success(self) -> None:
-        """Test successful dry-run check with valid config."""
-        with TemporaryDirectory() as tmpdir:
-            # Create input file
-            input_file = Path(tmpdir) / 'input.parquet'
-            input_df = pl.DataFrame({'amount': [100, 200, 300], 'item': ['a', 'b', 'c']})
-            input_df.write_parquet(input_file)
-
-            # Create config file
-            config_file = Path(tmpdir) / 'config.toml'
-            config_content = f"""\
-[[input_plugins]]
-name = "parquet_scan"
-module = "cryoflow_plugin_collections.input.parquet_scan"
-enabled = true
-
-[input_plugins.options]
-input_path = "{input_file}"
-
-[[transform_plugins]]
-name = "column_multiplier"
-module = "cryoflow_plugin_collections.transform.multiplier"
-enabled = true
-
-[transform_plugins.options]
-column_name = "amount"
-multiplier = 2
-
-[[output_plugins]]
-name = "parquet_writer"
-module = "cryoflow_plugin_collections.output.parquet_writer"
-enabled = true
-
-[output_plugins.options]
-output_path = "{tmpdir}/output.parquet"
-"""
-            config_file.write_text(config_content)
-
-            # Run check command
-            runner = CliRunner()
-            result = runner.invoke(app, ['check', '-c', str(config_file)])
+    def test_check_command_success(self, shared_config_file: Path) -> None:
+        """Test successful dry-run check with valid config (real plugin loading)."""
+        runner = CliRunner()
+        result = runner.invoke(app, ['check', '-c', str(shared_config_file)])
 
-            # Verify success
-            assert result.exit_code == 0
-            assert '[SUCCESS] Validation completed successfully' in result.stdout
-            assert 'Output schema:' in result.stdout
-            # Verify schema columns are listed
-            assert 'amount' in result.stdout
-            assert 'item' in result.stdout
+        # Verify success
+        assert result.exit_code == 0
+        assert VALIDATION_SUCCESS in result.stdout
+        assert 'Output schema:' in result.stdout
+        # Verify schema columns are listed
+        assert 'amount' in result.stdout
+        assert 'item' in result.stdout
 
     def test_check_command_missing_config(self) -> None:
         """Test check command with missing config file."""
@@ -70,72 +36,37 @@ output_path = "{tmpdir}/output.parquet"
         # Verify error
         assert result.exit_code == 2  # Typer validation error
 
-    def test_check_command_with_verbose(self) -> None:
+    def test_check_command_with_verbose(
+        self,
+        shared_config_file: Path,
+        shared_plugin_manager: pluggy.PluginManager,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test check command with verbose flag."""
-        with TemporaryDirectory() as tmpdir:
-            # Create input file
-            input_file = Path(tmpdir) / 'input.parquet'
-            input_df = pl.DataFrame({'value': [1, 2, 3]})
-            input_df.write_parquet(input_file)
-
-            # Create config file
-            config_file = Path(tmpdir) / 'config.toml'
-            config_content = f"""\
-[[input_plugins]]
-name = "parquet_scan"
-module = "cryoflow_plugin_collections.input.parquet_scan"
-enabled = true
+        monkeypatch.setattr(check_mod, 'load_plugins', lambda *_: shared_plugin_manager)
 
-[input_plugins.options]
-input_path = "{input_file}"
-
-[[transform_plugins]]
-name = "column_multiplier"
-module = "cryoflow_plugin_collections.transform.multiplier"
-enabled = true
-
-[transform_plugins.options]
-column_name = "value"
-multiplier = 2
-
-[[output_plugins]]
-name = "parquet_writer"
-module = "cryoflow_plugin_collections.output.parquet_writer"
-enabled = true
-
-[output_plugins.options]
-output_path = "{tmpdir}/output.parquet"
-"""
-            config_file.write_text(config_content)
-
-            # Run check command with verbose flag
-            runner = CliRunner()
-            result = runner.invoke(app, ['check', '-c', str(config_file), '-V'])
+        # Run check command with verbose flag
+        runner = CliRunner()
+        result = runner.invoke(app, ['check', '-c', str(shared_config_file), '-V'])
 
-            # Verify success and verbose output
-            assert result.exit_code == 0
-            assert '[SUCCESS] Validation completed successfully' in result.stdout
-            # Verbose output should contain INFO/DEBUG logs
-            assert 'Validating' in result.stdout or '[SUCCESS]' in result.stdout
+        # Verify success and verbose output
+        assert result.exit_code == 0
+        assert VALIDATION_SUCCESS in result.stdout
+        # Verbose output should contain INFO/DEBUG logs
+        assert 'Validating' in result.stdout or '[SUCCESS]' in result.stdout
 
-    def test_check_command_transform_validation_fails(self) -> None:
+    def test_check_command_transform_validation_fails(self, shared_input_parquet: Path, tmp_path: Path) -> None:
         """Test check command when transform validation fails."""
-        with TemporaryDirectory() as tmpdir:
-            # Create input file
-            input_file = Path(tmpdir) / 'input.parquet'
-            input_df = pl.DataFrame({'value': [1, 2, 3]})
-            input_df.write_parquet(input_file)
-
-            # Create config file with invalid column name
-            config_file = Path(tmpdir) / 'config.toml'
-            config_content = f"""\
+        # Create config file with invalid column name
+        config_file = tmp_path / 'config.toml'
+        config_content = f"""\
 [[input_plugins]]
 name = "parquet_scan"
 module = "cryoflow_plugin_collections.input.parquet_scan"
 enabled = true
 
 [input_plugins.options]
-input_path = "{input_file}"
+input_path = "{shared_input_parquet}"
 
 [[transform_plugins]]
 name = "column_multiplier"
@@ -152,15 +83,15 @@ module = "cryoflow_plugin_collections.output.parquet_writer"
 enabled = true
 
 [output_plugins.options]
-output_path = "{tmpdir}/output.parquet"
+output_path = "{tmp_path}/output.parquet"
 """
-            config_file.write_text(config_content)
+        config_file.write_text(config_content)
 
-            # Run check command
-            runner = CliRunner()
-            result = runner.invoke(app, ['check', '-c', str(config_file)])
+        # Run check command
+        runner = CliRunner()
+        result = runner.invoke(app, ['check', '-c', str(config_file)])
 
-            # Verify error
-            assert result.exit_code == 1
-            assert '[ERROR]' in result.stdout or '[ERROR]' in result.stderr
-            assert 'Validation failed' in result.stdout or 'Validation failed' in result.stderr
+        # Verify error
+        assert result.exit_code == 1
+        assert '[ERROR]' in result.stdout or '[ERROR]' in result.stderr
+        assert 'Validation failed' in result.stdout or 'Validation failed' in result.stderr
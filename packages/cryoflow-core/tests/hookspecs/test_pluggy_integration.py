@@ -1,90 +1,91 @@
 """Tests for pluggy integration with hookspecs."""
 
-from pathlib import Path
-
 import pluggy
 
-from cryoflow_core.hookspecs import CryoflowSpecs, hookimpl
+from cryoflow_core.hookspecs import hookimpl
 from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
 
-from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
+from ..conftest import UNUSED_CONFIG_DIR, DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
 
 
-class TestPluggyIntegration:
-    def test_input_hookspec_registration_and_call(self, tmp_path: Path):
-        """Register hookspec, add hookimpl for input, call hook, verify results."""
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
+class _InputHookImpl:
+    """Module-level hookimpl returning the input plugins it was built with."""
+
+    def __init__(self, plugins: list[InputPlugin]) -> None:
+        self._plugins = plugins
+
+    @hookimpl
+    def register_input_plugins(self) -> list[InputPlugin]:
+        return self._plugins
+
+
+class _TransformHookImpl:
+    """Module-level hookimpl returning the transform plugins it was built with."""
+
+    def __init__(self, plugins: list[TransformPlugin]) -> None:
+        self._plugins = plugins
+
+    @hookimpl
+    def register_transform_plugins(self) -> list[TransformPlugin]:
+        return self._plugins
+
+
+class _OutputHookImpl:
+    """Module-level hookimpl returning the output plugins it was built with."""
 
-        inp = DummyInputPlugin({}, tmp_path)
+    def __init__(self, plugins: list[OutputPlugin]) -> None:
+        self._plugins = plugins
 
-        class MyHookImpl:
-            @hookimpl
-            def register_input_plugins(self) -> list[InputPlugin]:
-                return [inp]
+    @hookimpl
+    def register_output_plugins(self) -> list[OutputPlugin]:
+        return self._plugins
 
-        pm.register(MyHookImpl())
+
+class TestPluggyIntegration:
+    def test_input_hookspec_registration_and_call(self, fresh_pm: pluggy.PluginManager, dummy_input: DummyInputPlugin):
+        """Register hookspec, add hookimpl for input, call hook, verify results."""
+        pm = fresh_pm
+
+        inp = dummy_input
+        pm.register(_InputHookImpl([inp]))
         results = pm.hook.register_input_plugins()
         flat = [p for sublist in results for p in sublist]
         assert len(flat) == 1
         assert flat[0] is inp
 
-    def test_hookspec_registration_and_call(self, tmp_path: Path):
+    def test_hookspec_registration_and_call(
+        self, fresh_pm: pluggy.PluginManager, dummy_transform: DummyTransformPlugin
+    ):
         """Register hookspec, add hookimpl, call hook, verify results."""
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-
-        transform = DummyTransformPlugin({}, tmp_path)
+        pm = fresh_pm
 
-        class MyHookImpl:
-            @hookimpl
-            def register_transform_plugins(self) -> list[TransformPlugin]:
-                return [transform]
-
-        pm.register(MyHookImpl())
+        transform = dummy_transform
+        pm.register(_TransformHookImpl([transform]))
         results = pm.hook.register_transform_plugins()
         # pluggy returns a list of lists (one per hookimpl)
         flat = [p for sublist in results for p in sublist]
         assert len(flat) == 1
         assert flat[0] is transform
 
-    def test_output_hookimpl(self, tmp_path: Path):
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-
-        output = DummyOutputPlugin({}, tmp_path)
-
-        class MyOutputHookImpl:
-            @hookimpl
-            def register_output_plugins(self) -> list[OutputPlugin]:
-                return [output]
+    def test_output_hookimpl(self, fresh_pm: pluggy.PluginManager, dummy_output: DummyOutputPlugin):
+        pm = fresh_pm
 
-        pm.register(MyOutputHookImpl())
+        output = dummy_output
+        pm.register(_OutputHookImpl([output]))
         results = pm.hook.register_output_plugins()
         flat = [p for sublist in results for p in sublist]
         assert len(flat) == 1
         assert flat[0] is output
 
-    def test_multiple_hookimpls(self, tmp_path: Path):
+    def test_multiple_hookimpls(self, fresh_pm: pluggy.PluginManager):
         """Multiple hookimpls should all contribute to the result."""
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-
-        t1 = DummyTransformPlugin({'id': '1'}, tmp_path)
-        t2 = DummyTransformPlugin({'id': '2'}, tmp_path)
-
-        class Impl1:
-            @hookimpl
-            def register_transform_plugins(self) -> list[TransformPlugin]:
-                return [t1]
+        pm = fresh_pm
 
-        class Impl2:
-            @hookimpl
-            def register_transform_plugins(self) -> list[TransformPlugin]:
-                return [t2]
+        t1 = DummyTransformPlugin({'id': '1'}, UNUSED_CONFIG_DIR)
+        t2 = DummyTransformPlugin({'id': '2'}, UNUSED_CONFIG_DIR)
 
-        pm.register(Impl1())
-        pm.register(Impl2())
+        pm.register(_TransformHookImpl([t1]))
+        pm.register(_TransformHookImpl([t2]))
 
         results = pm.hook.register_transform_plugins()
         flat = [p for sublist in results for p in sublist]
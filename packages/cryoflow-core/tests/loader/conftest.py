@@ -1,16 +1,20 @@
 """Fixtures and constants for loader tests."""
 
 import sys
+import types
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+from cryoflow_core.loader import _load_module_from_path
 
-
-INPUT_PLUGIN_SOURCE = """\
-from typing import Any
+_PLUGIN_SOURCE_HEADER = """\
 import polars as pl
 from returns.result import Success, Result
-from cryoflow_core.plugin import InputPlugin, FrameData
+from cryoflow_core.plugin import InputPlugin, TransformPlugin, OutputPlugin, FrameData
+"""
+
+_INPUT_PLUGIN_BODY = """\
 
 
 class MyInputPlugin(InputPlugin):
@@ -24,11 +28,7 @@ class MyInputPlugin(InputPlugin):
         return Success({'a': pl.Int64})
 """
 
-TRANSFORM_PLUGIN_SOURCE = """\
-from typing import Any
-import polars as pl
-from returns.result import Success, Result
-from cryoflow_core.plugin import TransformPlugin, FrameData
+_TRANSFORM_PLUGIN_BODY = """\
 
 
 class MyTransformPlugin(TransformPlugin):
@@ -44,11 +44,7 @@ class MyTransformPlugin(TransformPlugin):
         return Success(schema)
 """
 
-OUTPUT_PLUGIN_SOURCE = """\
-from typing import Any
-import polars as pl
-from returns.result import Success, Result
-from cryoflow_core.plugin import OutputPlugin, FrameData
+_OUTPUT_PLUGIN_BODY = """\
 
 
 class MyOutputPlugin(OutputPlugin):
@@ -64,7 +60,10 @@ class MyOutputPlugin(OutputPlugin):
         return Success(schema)
 """
 
-BOTH_PLUGINS_SOURCE = TRANSFORM_PLUGIN_SOURCE + '\n' + OUTPUT_PLUGIN_SOURCE
+INPUT_PLUGIN_SOURCE = _PLUGIN_SOURCE_HEADER + _INPUT_PLUGIN_BODY
+TRANSFORM_PLUGIN_SOURCE = _PLUGIN_SOURCE_HEADER + _TRANSFORM_PLUGIN_BODY
+OUTPUT_PLUGIN_SOURCE = _PLUGIN_SOURCE_HEADER + _OUTPUT_PLUGIN_BODY
+BOTH_PLUGINS_SOURCE = _PLUGIN_SOURCE_HEADER + _TRANSFORM_PLUGIN_BODY + _OUTPUT_PLUGIN_BODY
 
 SYNTAX_ERROR_SOURCE = """\
 def broken(
@@ -77,42 +76,89 @@ x = 42
 """
 
 
-@pytest.fixture()
-def input_plugin_py_file(tmp_path: Path):
-    """Create a .py file with an InputPlugin implementation."""
-    p = tmp_path / 'my_input_plugin.py'
+@pytest.fixture(scope='session')
+def plugin_source_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide directory holding the plugin source files, which never change between tests."""
+    return tmp_path_factory.mktemp('plugin_sources')
+
+
+@pytest.fixture(scope='session')
+def config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a config.toml path for load_plugins (shared across the session).
+
+    load_plugins only resolves the parent directory to anchor relative plugin
+    paths and never opens the config file, so the file itself is not created.
+    """
+    return tmp_path_factory.mktemp('cfg') / 'config.toml'
+
+
+@pytest.fixture(scope='session')
+def resolved_plugin_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a config directory with plugin files at the top level and under plugins/ (once per session)."""
+    root = tmp_path_factory.mktemp('resolved')
+    (root / 'plugins').mkdir()
+    (root / 'plugins' / 'my_plugin.py').write_text('# plugin')
+    (root / 'my_plugin.py').write_text('# plugin')
+    return root
+
+
+@pytest.fixture(scope='session')
+def input_plugin_py_file(plugin_source_dir: Path) -> Path:
+    """Create a .py file with an InputPlugin implementation (written once per session)."""
+    p = plugin_source_dir / 'my_input_plugin.py'
     p.write_text(INPUT_PLUGIN_SOURCE)
     return p
 
 
-@pytest.fixture()
-def plugin_py_file(tmp_path: Path):
-    """Create a .py file with a TransformPlugin implementation."""
-    p = tmp_path / 'my_plugin.py'
+@pytest.fixture(scope='session')
+def plugin_py_file(plugin_source_dir: Path) -> Path:
+    """Create a .py file with a TransformPlugin implementation (written once per session)."""
+    p = plugin_source_dir / 'my_plugin.py'
     p.write_text(TRANSFORM_PLUGIN_SOURCE)
     return p
 
 
-@pytest.fixture()
-def output_plugin_py_file(tmp_path: Path):
-    """Create a .py file with an OutputPlugin implementation."""
-    p = tmp_path / 'my_output_plugin.py'
+@pytest.fixture(scope='session')
+def output_plugin_py_file(plugin_source_dir: Path) -> Path:
+    """Create a .py file with an OutputPlugin implementation (written once per session)."""
+    p = plugin_source_dir / 'my_output_plugin.py'
     p.write_text(OUTPUT_PLUGIN_SOURCE)
     return p
 
 
-@pytest.fixture()
-def both_plugins_py_file(tmp_path: Path):
-    """Create a .py file with both Transform and Output plugins."""
-    p = tmp_path / 'both_plugins.py'
+@pytest.fixture(scope='session')
+def both_plugins_py_file(plugin_source_dir: Path) -> Path:
+    """Create a .py file with both Transform and Output plugins (written once per session)."""
+    p = plugin_source_dir / 'both_plugins.py'
     p.write_text(BOTH_PLUGINS_SOURCE)
     return p
 
 
+# Installed package sharing the ``cryoflow_plugin_`` prefix; keep it cached across tests
+_COLLECTIONS_PACKAGE = 'cryoflow_plugin_collections'
+
+
+@pytest.fixture()
+def input_plugin_module(input_plugin_py_file: Path) -> types.ModuleType:
+    """Return the module loaded from the InputPlugin source file."""
+    return _load_module_from_path('my_input', input_plugin_py_file)
+
+
+@pytest.fixture()
+def both_plugins_module(both_plugins_py_file: Path) -> types.ModuleType:
+    """Return the module loaded from the Transform and Output plugin source file."""
+    return _load_module_from_path('both', both_plugins_py_file)
+
+
 @pytest.fixture(autouse=True)
-def cleanup_sys_modules():
-    """Remove cryoflow_plugin_* entries from sys.modules after each test."""
+def cleanup_sys_modules() -> Iterator[None]:
+    """Pop the cryoflow_plugin_* modules a test added to sys.modules once it finishes."""
+    before = set(sys.modules)
     yield
-    to_remove = [k for k in sys.modules if k.startswith('cryoflow_plugin_')]
-    for k in to_remove:
-        del sys.modules[k]
+    for name in set(sys.modules) - before:
+        if (
+            name.startswith('cryoflow_plugin_')
+            and name != _COLLECTIONS_PACKAGE
+            and not name.startswith(f'{_COLLECTIONS_PACKAGE}.')
+        ):
+            del sys.modules[name]
@@ -10,35 +10,60 @@ from cryoflow_core.plugin import BasePlugin, InputPlugin, TransformPlugin
 from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
 
 
+@pytest.fixture()
+def fake_module() -> types.ModuleType:
+    """Return a fresh, empty module object for a test to populate."""
+    return types.ModuleType('fake_mod')
+
+
 class TestDiscoverPluginClasses:
-    def test_discovers_concrete_classes(self):
-        mod = types.ModuleType('fake_mod')
-        setattr(mod, 'DummyInputPlugin', DummyInputPlugin)  # pyright: ignore[reportAttributeAccessIssue]
-        setattr(mod, 'DummyTransformPlugin', DummyTransformPlugin)  # pyright: ignore[reportAttributeAccessIssue]
-        setattr(mod, 'DummyOutputPlugin', DummyOutputPlugin)  # pyright: ignore[reportAttributeAccessIssue]
-        classes = _discover_plugin_classes('test', mod)
-        assert DummyInputPlugin in classes
-        assert DummyTransformPlugin in classes
-        assert DummyOutputPlugin in classes
-
-    def test_excludes_abstract_classes(self):
-        mod = types.ModuleType('fake_mod')
-        setattr(mod, 'TransformPlugin', TransformPlugin)  # pyright: ignore[reportAttributeAccessIssue]
-        setattr(mod, 'InputPlugin', InputPlugin)  # pyright: ignore[reportAttributeAccessIssue]
-        setattr(mod, 'DummyTransformPlugin', DummyTransformPlugin)  # pyright: ignore[reportAttributeAccessIssue]
-        classes = _discover_plugin_classes('test', mod)
-        assert TransformPlugin not in classes
-        assert InputPlugin not in classes
-        assert DummyTransformPlugin in classes
-
-    def test_excludes_base_classes(self):
-        mod = types.ModuleType('fake_mod')
-        setattr(mod, 'BasePlugin', BasePlugin)  # pyright: ignore[reportAttributeAccessIssue]
-        setattr(mod, 'DummyTransformPlugin', DummyTransformPlugin)  # pyright: ignore[reportAttributeAccessIssue]
-        classes = _discover_plugin_classes('test', mod)
-        assert BasePlugin not in classes
-
-    def test_empty_module_raises(self):
-        mod = types.ModuleType('empty_mod')
+    @pytest.mark.parametrize(
+        'attrs,present,absent',
+        [
+            pytest.param(
+                {
+                    'DummyInputPlugin': DummyInputPlugin,
+                    'DummyTransformPlugin': DummyTransformPlugin,
+                    'DummyOutputPlugin': DummyOutputPlugin,
+                },
+                [DummyInputPlugin, DummyTransformPlugin, DummyOutputPlugin],
+                [],
+                id='concrete_classes',
+            ),
+            pytest.param(
+                {
+                    'TransformPlugin': TransformPlugin,
+                    'InputPlugin': InputPlugin,
+                    'DummyTransformPlugin': DummyTransformPlugin,
+                },
+                [DummyTransformPlugin],
+                [TransformPlugin, InputPlugin],
+                id='abstract_classes',
+            ),
+            pytest.param(
+                {'BasePlugin': BasePlugin, 'DummyTransformPlugin': DummyTransformPlugin},
+                [DummyTransformPlugin],
+                [BasePlugin],
+                id='base_classes',
+            ),
+        ],
+    )
+    def test_discover(
+        self,
+        fake_module: types.ModuleType,
+        attrs: dict[str, type[BasePlugin]],
+        present: list[type[BasePlugin]],
+        absent: list[type[BasePlugin]],
+    ):
+        vars(fake_module).update(attrs)
+        classes = _discover_plugin_classes('test', fake_module)
+        assert all(cls in classes for cls in present)
+        assert not any(cls in classes for cls in absent)
+
+    def test_empty_module_raises(self, fake_module: types.ModuleType):
         with pytest.raises(PluginLoadError, match='no BasePlugin subclasses'):
-            _discover_plugin_classes('empty', mod)
+            _discover_plugin_classes('empty', fake_module)
+
+    def test_discovers_classes_from_plugin_source(self, both_plugins_module: types.ModuleType):
+        classes = _discover_plugin_classes('both', both_plugins_module)
+        assert {cls.__name__ for cls in classes} == {'MyTransformPlugin', 'MyOutputPlugin'}
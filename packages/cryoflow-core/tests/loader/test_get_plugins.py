@@ -12,65 +12,58 @@ from cryoflow_core.plugin import BasePlugin, InputPlugin, OutputPlugin, Transfor
 from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
 
 
-class TestGetPlugins:
-    def test_get_plugins_empty_input(self):
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-        relay = _PluginHookRelay([], [], [])
-        pm.register(relay)
-        assert get_plugins(pm, InputPlugin) == []
+def _make_pm(relay: _PluginHookRelay) -> pluggy.PluginManager:
+    pm = pluggy.PluginManager('cryoflow')
+    pm.add_hookspecs(CryoflowSpecs)
+    pm.register(relay)
+    return pm
 
-    def test_get_plugins_empty_transform(self):
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-        relay = _PluginHookRelay([], [], [])
-        pm.register(relay)
-        assert get_plugins(pm, TransformPlugin) == []
 
-    def test_get_plugins_empty_output(self):
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-        relay = _PluginHookRelay([], [], [])
-        pm.register(relay)
-        assert get_plugins(pm, OutputPlugin) == []
+@pytest.fixture()
+def empty_pm() -> pluggy.PluginManager:
+    """PluginManager with a relay that registers no plugins."""
+    return _make_pm(_PluginHookRelay([], [], []))
 
-    def test_get_plugins_with_input(self, tmp_path: Path):
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-        i = DummyInputPlugin({}, tmp_path)
-        relay = _PluginHookRelay([i], [], [])
-        pm.register(relay)
-        result = get_plugins(pm, InputPlugin)
-        assert len(result) == 1
-        assert result[0] is i
 
-    def test_get_plugins_with_transform(self, tmp_path: Path):
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-        t = DummyTransformPlugin({}, tmp_path)
-        relay = _PluginHookRelay([], [t], [])
-        pm.register(relay)
-        result = get_plugins(pm, TransformPlugin)
-        assert len(result) == 1
-        assert result[0] is t
+@pytest.fixture(
+    params=[
+        (InputPlugin, DummyInputPlugin),
+        (TransformPlugin, DummyTransformPlugin),
+        (OutputPlugin, DummyOutputPlugin),
+    ],
+    ids=['input', 'transform', 'output'],
+)
+def populated_pm(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> tuple[pluggy.PluginManager, type[BasePlugin], BasePlugin]:
+    """PluginManager whose relay registers a single plugin of the parametrized type.
+
+    Returns:
+        Tuple of (pm, plugin_type, registered plugin instance).
+    """
+    plugin_type, plugin_cls = request.param
+    plugin = plugin_cls({}, tmp_path)
+    relay = _PluginHookRelay(
+        [plugin] if isinstance(plugin, InputPlugin) else [],
+        [plugin] if isinstance(plugin, TransformPlugin) else [],
+        [plugin] if isinstance(plugin, OutputPlugin) else [],
+    )
+    return _make_pm(relay), plugin_type, plugin
 
-    def test_get_plugins_with_output(self, tmp_path: Path):
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-        o = DummyOutputPlugin({}, tmp_path)
-        relay = _PluginHookRelay([], [], [o])
-        pm.register(relay)
-        result = get_plugins(pm, OutputPlugin)
+
+class TestGetPlugins:
+    @pytest.mark.parametrize('plugin_type', [InputPlugin, TransformPlugin, OutputPlugin])
+    def test_get_plugins_empty(self, empty_pm: pluggy.PluginManager, plugin_type: type[BasePlugin]):
+        assert get_plugins(empty_pm, plugin_type) == []
+
+    def test_get_plugins_populated(self, populated_pm: tuple[pluggy.PluginManager, type[BasePlugin], BasePlugin]):
+        pm, plugin_type, plugin = populated_pm
+        result = get_plugins(pm, plugin_type)
         assert len(result) == 1
-        assert result[0] is o
+        assert result[0] is plugin
 
-    def test_get_plugins_unsupported_type(self):
+    def test_get_plugins_unsupported_type(self, empty_pm: pluggy.PluginManager):
         """Test that ValueError is raised for unsupported plugin types."""
-        pm = pluggy.PluginManager('cryoflow')
-        pm.add_hookspecs(CryoflowSpecs)
-        relay = _PluginHookRelay([], [], [])
-        pm.register(relay)
-
         # BasePlugin directly should raise an error
         with pytest.raises(ValueError, match='Unsupported plugin type'):
-            get_plugins(pm, BasePlugin)
+            get_plugins(empty_pm, BasePlugin)
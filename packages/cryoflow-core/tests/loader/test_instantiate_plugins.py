@@ -1,10 +1,12 @@
 """Tests for _instantiate_plugins function."""
 
+import types
 from pathlib import Path
 
 import pytest
 
-from cryoflow_core.loader import PluginLoadError, _instantiate_plugins
+from cryoflow_core.loader import PluginLoadError, _discover_plugin_classes, _instantiate_plugins
+from cryoflow_core.plugin import InputPlugin
 
 from ..conftest import BrokenInitPlugin, DummyOutputPlugin, DummyTransformPlugin
 
@@ -33,6 +35,12 @@ class TestInstantiatePlugins:
         instances = _instantiate_plugins('test', [DummyTransformPlugin], opts, tmp_path)
         assert instances[0].label == 'default'
 
+    def test_instantiates_classes_from_plugin_source(self, tmp_path: Path, input_plugin_module: types.ModuleType):
+        classes = _discover_plugin_classes('my_input', input_plugin_module)
+        instances = _instantiate_plugins('my_input', classes, {}, tmp_path)
+        assert len(instances) == 1
+        assert isinstance(instances[0], InputPlugin)
+
     def test_broken_init_raises(self, tmp_path: Path):
         with pytest.raises(PluginLoadError, match='failed to instantiate'):
             _instantiate_plugins('test', [BrokenInitPlugin], {}, tmp_path)
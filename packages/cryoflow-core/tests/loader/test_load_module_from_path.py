@@ -17,6 +17,15 @@ class TestLoadModuleFromPath:
         assert hasattr(module, 'MyTransformPlugin')
         assert 'cryoflow_plugin_test_plugin' in sys.modules
 
+    def test_changed_source_reexecutes_module(self, tmp_path: Path):
+        plugin_file = tmp_path / 'changing.py'
+        plugin_file.write_text('VALUE = 1\n')
+        first = _load_module_from_path('changing', plugin_file)
+        plugin_file.write_text('VALUE = 2\n')
+        second = _load_module_from_path('changing', plugin_file)
+        assert second is not first
+        assert second.VALUE == 2
+
     def test_syntax_error_raises(self, tmp_path: Path):
         bad_file = tmp_path / 'bad.py'
         bad_file.write_text(SYNTAX_ERROR_SOURCE)
@@ -8,7 +8,7 @@ import pytest
 from cryoflow_core.config import CryoflowConfig, PluginConfig
 from cryoflow_core.hookspecs import CryoflowSpecs
 from cryoflow_core.loader import PluginLoadError, get_plugins, load_plugins
-from cryoflow_core.plugin import InputPlugin, OutputPlugin, TransformPlugin
+from cryoflow_core.plugin import BasePlugin, InputPlugin, OutputPlugin, TransformPlugin
 
 
 class TestLoadPlugins:
@@ -18,57 +18,66 @@ class TestLoadPlugins:
         transform_plugins: list[PluginConfig] | None = None,
         output_plugins: list[PluginConfig] | None = None,
     ) -> CryoflowConfig:
-        return CryoflowConfig(
+        # Built from trusted literals, so skip pydantic validation (defaults are still applied)
+        return CryoflowConfig.model_construct(
             input_plugins=input_plugins or [],
             transform_plugins=transform_plugins or [],
             output_plugins=output_plugins or [],
         )
 
-    def test_empty_plugins(self, tmp_path: Path):
+    def test_empty_plugins(self, config_path: Path):
         cfg = self._make_config()
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
-        pm = load_plugins(cfg, config_file)
+        pm = load_plugins(cfg, config_path)
         assert isinstance(pm, pluggy.PluginManager)
 
-    def test_disabled_plugin_skipped(self, tmp_path: Path, plugin_py_file: Path):
+    def test_disabled_plugin_skipped(self, config_path: Path, plugin_py_file: Path, fresh_pm: pluggy.PluginManager):
         cfg = self._make_config(
             transform_plugins=[
-                PluginConfig(
+                PluginConfig.model_construct(
                     name='skipped',
                     module=str(plugin_py_file),
                     enabled=False,
                 )
             ]
         )
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
-        pm = load_plugins(cfg, config_file)
+        pm = load_plugins(cfg, config_path, pm=fresh_pm)
         transforms = get_plugins(pm, TransformPlugin)
         assert len(transforms) == 0
 
-    def test_input_plugin_loaded(self, tmp_path, input_plugin_py_file: Path):
-        cfg = self._make_config(
-            input_plugins=[
-                PluginConfig(
-                    name='my_input',
-                    module=str(input_plugin_py_file),
-                    enabled=True,
-                )
-            ]
-        )
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
-        pm = load_plugins(cfg, config_file)
-        inputs = get_plugins(pm, InputPlugin)
-        assert len(inputs) == 1
-        assert inputs[0].name() == 'my_input'
+    @pytest.mark.parametrize(
+        'config_field,plugin_type,plugin_name,source_fixture',
+        [
+            ('input_plugins', InputPlugin, 'my_input', 'input_plugin_py_file'),
+            ('transform_plugins', TransformPlugin, 'my_transform', 'plugin_py_file'),
+            ('output_plugins', OutputPlugin, 'my_output', 'output_plugin_py_file'),
+        ],
+        ids=['input', 'transform', 'output'],
+    )
+    def test_plugin_loaded(
+        self,
+        config_field: str,
+        plugin_type: type[BasePlugin],
+        plugin_name: str,
+        source_fixture: str,
+        request: pytest.FixtureRequest,
+        config_path: Path,
+        fresh_pm: pluggy.PluginManager,
+    ):
+        source_file: Path = request.getfixturevalue(source_fixture)
+        plugin_cfg = PluginConfig.model_construct(name=plugin_name, module=str(source_file), enabled=True)
+        cfg = self._make_config(**{config_field: [plugin_cfg]})
+        pm = load_plugins(cfg, config_path, pm=fresh_pm)
+        plugins = get_plugins(pm, plugin_type)
+        assert len(plugins) == 1
+        assert plugins[0].name() == plugin_name
 
-    def test_input_plugin_label_propagated(self, tmp_path: Path, input_plugin_py_file: Path):
+    def test_input_plugin_label_propagated(
+        self, config_path: Path, input_plugin_py_file: Path, fresh_pm: pluggy.PluginManager
+    ):
         """Test that label from PluginConfig is passed to the plugin instance."""
         cfg = self._make_config(
             input_plugins=[
-                PluginConfig(
+                PluginConfig.model_construct(
                     name='my_input',
                     module=str(input_plugin_py_file),
                     enabled=True,
@@ -76,109 +85,67 @@ class TestLoadPlugins:
                 )
             ]
         )
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
-        pm = load_plugins(cfg, config_file)
+        pm = load_plugins(cfg, config_path, pm=fresh_pm)
         inputs = get_plugins(pm, InputPlugin)
         assert len(inputs) == 1
         assert inputs[0].label == 'sales'
 
-    def test_transform_plugin_loaded(self, tmp_path: Path, plugin_py_file: Path):
-        cfg = self._make_config(
-            transform_plugins=[
-                PluginConfig(
-                    name='my_transform',
-                    module=str(plugin_py_file),
-                    enabled=True,
-                )
-            ]
-        )
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
-        pm = load_plugins(cfg, config_file)
-        transforms = get_plugins(pm, TransformPlugin)
-        assert len(transforms) == 1
-        assert transforms[0].name() == 'my_transform'
-
-    def test_output_plugin_loaded(self, tmp_path: Path, output_plugin_py_file: Path):
-        cfg = self._make_config(
-            output_plugins=[
-                PluginConfig(
-                    name='my_output',
-                    module=str(output_plugin_py_file),
-                    enabled=True,
-                )
-            ]
-        )
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
-        pm = load_plugins(cfg, config_file)
-        outputs = get_plugins(pm, OutputPlugin)
-        assert len(outputs) == 1
-        assert outputs[0].name() == 'my_output'
-
-    def test_existing_pm_accepted(self, tmp_path: Path):
+    def test_existing_pm_accepted(self, config_path: Path):
         cfg = self._make_config()
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
         existing_pm = pluggy.PluginManager('cryoflow')
         existing_pm.add_hookspecs(CryoflowSpecs)
-        pm = load_plugins(cfg, config_file, pm=existing_pm)
+        pm = load_plugins(cfg, config_path, pm=existing_pm)
         assert pm is existing_pm
 
-    def test_plugin_load_error_propagates(self, tmp_path: Path):
+    def test_plugin_load_error_propagates(self, tmp_path: Path, config_path: Path, fresh_pm: pluggy.PluginManager):
         cfg = self._make_config(
             transform_plugins=[
-                PluginConfig(
+                PluginConfig.model_construct(
                     name='bad',
                     module=str(tmp_path / 'nonexistent.py'),
                     enabled=True,
                 )
             ]
         )
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
         with pytest.raises(PluginLoadError):
-            load_plugins(cfg, config_file)
+            load_plugins(cfg, config_path, pm=fresh_pm)
 
-    def test_dotpath_plugin_loaded(self, tmp_path: Path):
+    def test_dotpath_plugin_loaded(self, config_path: Path, fresh_pm: pluggy.PluginManager):
         """Test the dotpath branch of _load_single_plugin (loader.py:158)."""
         cfg = self._make_config(
             transform_plugins=[
-                PluginConfig(
+                PluginConfig.model_construct(
                     name='dotpath_plugin',
                     module='tests.dotpath_test_plugin',
                     enabled=True,
                 )
             ]
         )
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
-        pm = load_plugins(cfg, config_file)
+        pm = load_plugins(cfg, config_path, pm=fresh_pm)
         transforms = get_plugins(pm, TransformPlugin)
         assert len(transforms) == 1
         assert transforms[0].name() == 'dotpath_transform'
 
-    def test_both_plugin_types(self, tmp_path: Path, plugin_py_file: Path, output_plugin_py_file: Path):
+    def test_both_plugin_types(
+        self, config_path: Path, plugin_py_file: Path, output_plugin_py_file: Path, fresh_pm: pluggy.PluginManager
+    ):
         cfg = self._make_config(
             transform_plugins=[
-                PluginConfig(
+                PluginConfig.model_construct(
                     name='my_transform',
                     module=str(plugin_py_file),
                     enabled=True,
                 )
             ],
             output_plugins=[
-                PluginConfig(
+                PluginConfig.model_construct(
                     name='my_output',
                     module=str(output_plugin_py_file),
                     enabled=True,
                 )
             ],
         )
-        config_file = tmp_path / 'config.toml'
-        config_file.write_text('')
-        pm = load_plugins(cfg, config_file)
+        pm = load_plugins(cfg, config_path, pm=fresh_pm)
         transforms = get_plugins(pm, TransformPlugin)
         outputs = get_plugins(pm, OutputPlugin)
         assert len(transforms) == 1
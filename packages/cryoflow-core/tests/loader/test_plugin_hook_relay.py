@@ -1,25 +1,23 @@
 """Tests for _PluginHookRelay class."""
 
-from pathlib import Path
-
 from cryoflow_core.loader import _PluginHookRelay
 
-from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
+from ..conftest import UNUSED_CONFIG_DIR, DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
 
 
 class TestPluginHookRelay:
-    def test_register_input_plugins(self, tmp_path: Path):
-        i = DummyInputPlugin({}, tmp_path)
+    def test_register_input_plugins(self):
+        i = DummyInputPlugin({}, UNUSED_CONFIG_DIR)
         relay = _PluginHookRelay([i], [], [])
         assert relay.register_input_plugins() == [i]
 
-    def test_register_transform_plugins(self, tmp_path: Path):
-        t = DummyTransformPlugin({}, tmp_path)
+    def test_register_transform_plugins(self):
+        t = DummyTransformPlugin({}, UNUSED_CONFIG_DIR)
         relay = _PluginHookRelay([], [t], [])
         assert relay.register_transform_plugins() == [t]
 
-    def test_register_output_plugins(self, tmp_path: Path):
-        o = DummyOutputPlugin({}, tmp_path)
+    def test_register_output_plugins(self):
+        o = DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
         relay = _PluginHookRelay([], [], [o])
         assert relay.register_output_plugins() == [o]
 
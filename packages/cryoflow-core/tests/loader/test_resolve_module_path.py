@@ -8,19 +8,21 @@ from cryoflow_core.loader import PluginLoadError, _resolve_module_path
 
 
 class TestResolveModulePath:
-    def test_relative_path(self, tmp_path: Path):
-        plugin_file = tmp_path / 'plugins' / 'my_plugin.py'
-        plugin_file.parent.mkdir(parents=True)
-        plugin_file.write_text('# plugin')
-        result = _resolve_module_path('plugins/my_plugin.py', tmp_path)
-        assert result == plugin_file.resolve()
+    def test_relative_path(self, resolved_plugin_tree: Path):
+        result = _resolve_module_path('plugins/my_plugin.py', resolved_plugin_tree)
+        assert result == (resolved_plugin_tree / 'plugins' / 'my_plugin.py').resolve()
 
-    def test_absolute_path(self, tmp_path: Path):
-        plugin_file = tmp_path / 'my_plugin.py'
-        plugin_file.write_text('# plugin')
-        result = _resolve_module_path(str(plugin_file), tmp_path)
+    def test_absolute_path(self, resolved_plugin_tree: Path):
+        plugin_file = resolved_plugin_tree / 'my_plugin.py'
+        result = _resolve_module_path(str(plugin_file), resolved_plugin_tree)
         assert result == plugin_file.resolve()
 
-    def test_nonexistent_path_raises(self, tmp_path: Path):
+    def test_nonexistent_path_raises(self, resolved_plugin_tree: Path):
         with pytest.raises(PluginLoadError, match='does not exist'):
-            _resolve_module_path('nonexistent.py', tmp_path)
+            _resolve_module_path('nonexistent.py', resolved_plugin_tree)
+
+    def test_symlink_loop_raises(self, tmp_path: Path):
+        loop = tmp_path / 'loop.py'
+        loop.symlink_to(loop)
+        with pytest.raises(PluginLoadError, match='Failed to resolve plugin file'):
+            _resolve_module_path(str(loop), tmp_path)
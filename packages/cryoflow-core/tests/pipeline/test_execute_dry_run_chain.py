@@ -1,85 +1,44 @@
 """Tests for execute_dry_run_chain function."""
 
-from pathlib import Path
+from __future__ import annotations
 
 import polars as pl
+import pytest
 from returns.result import Failure, Success
 
 from cryoflow_core.pipeline import execute_dry_run_chain
-from cryoflow_core.plugin import FrameData, TransformPlugin
+
+from ..conftest import UNUSED_CONFIG_DIR, DummyTransformPlugin, FailingTransformPlugin, assert_failure_contains
 
 
 class TestExecuteDryRunChain:
     """Tests for dry-run transformation chain execution."""
 
-    def test_empty_plugin_chain(self) -> None:
-        """Test dry-run with no transformation plugins."""
+    @pytest.mark.parametrize('n_plugins', [0, 1, 2])
+    def test_chain_success(self, n_plugins: int) -> None:
+        """Test that dry-run through 0, 1 or 2 identity plugins returns the schema unchanged."""
         schema: dict[str, pl.DataType] = {'a': pl.Int64(), 'b': pl.String()}
         initial = Success(schema)
-        result = execute_dry_run_chain(initial, [])
-
-        assert isinstance(result, Success)
-        assert result.unwrap() == schema
-
-    def test_single_plugin_success(self, tmp_path: Path) -> None:
-        """Test dry-run with single successful plugin."""
-        from returns.result import Success as SuccessResult
-
-        class DummyTransformPlugin(TransformPlugin):
-            def name(self) -> str:
-                return 'dummy_transform'
-
-            def execute(self, df: FrameData) -> SuccessResult[FrameData]:
-                return SuccessResult(df)
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
-
-        schema: dict[str, pl.DataType] = {'a': pl.Int64()}
-        initial = Success(schema)
-        result = execute_dry_run_chain(initial, [DummyTransformPlugin({}, tmp_path)])
+        plugins = [DummyTransformPlugin({}, UNUSED_CONFIG_DIR) for _ in range(n_plugins)]
+        result = execute_dry_run_chain(initial, plugins)
 
         assert isinstance(result, Success)
         assert result.unwrap() == schema
 
-    def test_plugin_validation_failure(self, tmp_path: Path) -> None:
+    def test_plugin_validation_failure(self) -> None:
         """Test dry-run where plugin validation fails."""
-        from returns.result import Failure as FailureResult
-
-        class FailingValidationPlugin(TransformPlugin):
-            def name(self) -> str:
-                return 'failing_validation'
-
-            def execute(self, df: FrameData) -> FailureResult[Exception]:
-                return FailureResult(ValueError('execution error'))
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> FailureResult[Exception]:
-                return FailureResult(ValueError("Column 'missing_col' not found"))
-
         schema: dict[str, pl.DataType] = {'a': pl.Int64()}
         initial = Success(schema)
-        result = execute_dry_run_chain(initial, [FailingValidationPlugin({}, tmp_path)])
+        plugin = FailingTransformPlugin({'dry_run_error': "Column 'missing_col' not found"}, UNUSED_CONFIG_DIR)
+        result = execute_dry_run_chain(initial, [plugin])
 
-        assert isinstance(result, Failure)
-        assert 'missing_col' in str(result.failure())
+        assert_failure_contains(result, 'missing_col')
 
-    def test_propagate_initial_failure(self, tmp_path: Path) -> None:
+    def test_propagate_initial_failure(self) -> None:
         """Test that initial Failure is propagated."""
-        from returns.result import Success as SuccessResult
-
-        class DummyPlugin(TransformPlugin):
-            def name(self) -> str:
-                return 'dummy'
-
-            def execute(self, df: FrameData) -> SuccessResult[FrameData]:
-                return SuccessResult(df)
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
-
         initial_error = ValueError('initial error')
         initial = Failure(initial_error)
-        result = execute_dry_run_chain(initial, [DummyPlugin({}, tmp_path)])
+        result = execute_dry_run_chain(initial, [DummyTransformPlugin({}, UNUSED_CONFIG_DIR)])
 
         assert isinstance(result, Failure)
         assert result.failure() == initial_error
@@ -1,57 +1,70 @@
 """Tests for execute_output function."""
 
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import polars as pl
-from returns.result import Failure, Success
+from returns.result import Failure, Result, Success
 
 from cryoflow_core.pipeline import execute_output
 from cryoflow_core.plugin import FrameData, OutputPlugin
 
+from ..conftest import UNUSED_CONFIG_DIR, DummyOutputPlugin
 
-class TestExecuteOutput:
-    """Tests for output plugin execution."""
+if TYPE_CHECKING:
+    import polars as pl
 
-    def test_output_success_data(self, sample_lazyframe, tmp_path: Path) -> None:
-        """Test output with successful data."""
-        from returns.result import Success as SuccessResult
 
-        class DummyOutputPlugin(OutputPlugin):
-            def name(self) -> str:
-                return 'dummy_output'
+class TrackingOutputPlugin(OutputPlugin):
+    """Output plugin that records its id in a shared list and optionally fails."""
 
-            def execute(self, df: FrameData) -> SuccessResult[None]:
-                return SuccessResult(None)
+    def __init__(
+        self,
+        track_id: str,
+        executed: list[str],
+        options: dict[str, Any],
+        config_dir: Path,
+        fail: bool = False,
+    ) -> None:
+        super().__init__(options, config_dir)
+        self._track_id = track_id
+        self._executed = executed
+        self._fail = fail
 
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
+    def name(self) -> str:
+        return f'tracking_{self._track_id}'
 
-        plugin = DummyOutputPlugin({}, tmp_path)
-        data = Success(sample_lazyframe)
-        result = execute_output(data, [plugin])
-        assert isinstance(result, Success)
+    def execute(self, df: FrameData) -> Result[None, Exception]:
+        self._executed.append(self._track_id)
+        if self._fail:
+            return Failure(ValueError('output failed'))
+        return Success(None)
 
-    def test_output_failure_data(self, tmp_path: Path) -> None:
-        """Test output with failed data (should not execute plugin)."""
-        from returns.result import Success as SuccessResult
+    def dry_run(self, schema: dict[str, pl.DataType]) -> Success[dict[str, pl.DataType]]:
+        return Success(schema)
 
-        class DummyOutputPlugin(OutputPlugin):
-            def name(self) -> str:
-                return 'dummy_output'
 
-            def execute(self, df: FrameData) -> SuccessResult[None]:
-                return SuccessResult(None)
+class TestExecuteOutput:
+    """Tests for output plugin execution."""
 
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
+    def test_output_success_data(self, sample_lazyframe) -> None:
+        """Test output with successful data."""
+        plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
+        data = Success(sample_lazyframe)
+        result = execute_output(data, [plugin])
+        assert isinstance(result, Success)
 
-        plugin = DummyOutputPlugin({}, tmp_path)
+    def test_output_failure_data(self) -> None:
+        """Test output with failed data (should not execute plugin)."""
+        executed: list[str] = []
+        plugin = TrackingOutputPlugin('only', executed, {}, UNUSED_CONFIG_DIR)
         error = ValueError('data processing error')
         data = Failure(error)
         result = execute_output(data, [plugin])
         assert isinstance(result, Failure)
         assert result.failure() == error
+        assert executed == []
 
     def test_output_empty_plugins(self, sample_lazyframe) -> None:
         """Test output with empty plugin list returns Success(None)."""
@@ -59,67 +72,24 @@ class TestExecuteOutput:
         result = execute_output(data, [])
         assert isinstance(result, Success)
 
-    def test_multiple_output_plugins_all_succeed(self, sample_lazyframe, tmp_path: Path) -> None:
+    def test_multiple_output_plugins_all_succeed(self, sample_lazyframe) -> None:
         """Test that all output plugins are executed when data succeeds."""
-        from returns.result import Success as SuccessResult
-
-        executed = []
-
-        class TrackingOutputPlugin(OutputPlugin):
-            def __init__(self, track_id: str, options: dict[str, Any], config_dir: Path) -> None:
-                super().__init__(options, config_dir)
-                self._track_id = track_id
-
-            def name(self) -> str:
-                return f'tracking_{self._track_id}'
-
-            def execute(self, df: FrameData) -> SuccessResult[None]:
-                executed.append(self._track_id)
-                return SuccessResult(None)
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
-
+        executed: list[str] = []
         plugins: list[OutputPlugin] = [
-            TrackingOutputPlugin('first', {}, tmp_path),
-            TrackingOutputPlugin('second', {}, tmp_path),
+            TrackingOutputPlugin('first', executed, {}, UNUSED_CONFIG_DIR),
+            TrackingOutputPlugin('second', executed, {}, UNUSED_CONFIG_DIR),
         ]
         data = Success(sample_lazyframe)
         result = execute_output(data, plugins)
         assert isinstance(result, Success)
         assert executed == ['first', 'second']
 
-    def test_multiple_output_plugins_stops_on_failure(self, sample_lazyframe, tmp_path: Path) -> None:
+    def test_multiple_output_plugins_stops_on_failure(self, sample_lazyframe) -> None:
         """Test that execution stops when a plugin fails."""
-        from returns.result import Failure as FailureResult, Success as SuccessResult
-
-        executed = []
-
-        class FailingOutputPlugin(OutputPlugin):
-            def name(self) -> str:
-                return 'failing_output'
-
-            def execute(self, df: FrameData) -> FailureResult[Exception]:
-                executed.append('failing')
-                return FailureResult(ValueError('output failed'))
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
-
-        class AfterOutputPlugin(OutputPlugin):
-            def name(self) -> str:
-                return 'after_output'
-
-            def execute(self, df: FrameData) -> SuccessResult[None]:
-                executed.append('after')
-                return SuccessResult(None)
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
-
-        plugins = [
-            FailingOutputPlugin({}, tmp_path),
-            AfterOutputPlugin({}, tmp_path),
+        executed: list[str] = []
+        plugins: list[OutputPlugin] = [
+            TrackingOutputPlugin('failing', executed, {}, UNUSED_CONFIG_DIR, fail=True),
+            TrackingOutputPlugin('after', executed, {}, UNUSED_CONFIG_DIR),
         ]
         data = Success(sample_lazyframe)
         result = execute_output(data, plugins)
@@ -1,76 +1,41 @@
 """Tests for execute_output_dry_run function."""
 
-from pathlib import Path
+from __future__ import annotations
 
 import polars as pl
 from returns.result import Failure, Success
 
 from cryoflow_core.pipeline import execute_output_dry_run
-from cryoflow_core.plugin import FrameData, OutputPlugin
+
+from ..conftest import UNUSED_CONFIG_DIR, DummyOutputPlugin, FailingOutputPlugin, assert_failure_contains
 
 
 class TestExecuteOutputDryRun:
     """Tests for output plugin dry-run execution."""
 
-    def test_output_dry_run_success(self, tmp_path: Path) -> None:
+    def test_output_dry_run_success(self) -> None:
         """Test output dry-run with successful validation."""
-        from returns.result import Success as SuccessResult
-
-        class DummyOutputPlugin(OutputPlugin):
-            def name(self) -> str:
-                return 'dummy_output'
-
-            def execute(self, df: FrameData) -> SuccessResult[None]:
-                return SuccessResult(None)
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
-
         schema: dict[str, pl.DataType] = {'a': pl.Int64(), 'b': pl.String()}
         initial = Success(schema)
-        result = execute_output_dry_run(initial, [DummyOutputPlugin({}, tmp_path)])
+        result = execute_output_dry_run(initial, [DummyOutputPlugin({}, UNUSED_CONFIG_DIR)])
 
         assert isinstance(result, Success)
         assert result.unwrap() == schema
 
-    def test_output_dry_run_failure(self, tmp_path: Path) -> None:
+    def test_output_dry_run_failure(self) -> None:
         """Test output dry-run with validation failure."""
-        from returns.result import Failure as FailureResult
-
-        class FailingOutputPlugin(OutputPlugin):
-            def name(self) -> str:
-                return 'failing_output'
-
-            def execute(self, df: FrameData) -> FailureResult[Exception]:
-                return FailureResult(ValueError('execution error'))
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> FailureResult[Exception]:
-                return FailureResult(ValueError('Invalid output schema'))
-
         schema: dict[str, pl.DataType] = {'a': pl.Int64()}
         initial = Success(schema)
-        result = execute_output_dry_run(initial, [FailingOutputPlugin({}, tmp_path)])
+        plugin = FailingOutputPlugin({'dry_run_error': 'Invalid output schema'}, UNUSED_CONFIG_DIR)
+        result = execute_output_dry_run(initial, [plugin])
 
-        assert isinstance(result, Failure)
-        assert 'Invalid output schema' in str(result.failure())
+        assert_failure_contains(result, 'Invalid output schema')
 
-    def test_output_dry_run_propagate_failure(self, tmp_path: Path) -> None:
+    def test_output_dry_run_propagate_failure(self) -> None:
         """Test that upstream failure is propagated."""
-        from returns.result import Success as SuccessResult
-
-        class DummyOutputPlugin(OutputPlugin):
-            def name(self) -> str:
-                return 'dummy_output'
-
-            def execute(self, df: FrameData) -> SuccessResult[None]:
-                return SuccessResult(None)
-
-            def dry_run(self, schema: dict[str, pl.DataType]) -> SuccessResult[dict[str, pl.DataType]]:
-                return SuccessResult(schema)
-
         upstream_error = ValueError('upstream error')
         initial = Failure(upstream_error)
-        result = execute_output_dry_run(initial, [DummyOutputPlugin({}, tmp_path)])
+        result = execute_output_dry_run(initial, [DummyOutputPlugin({}, UNUSED_CONFIG_DIR)])
 
         assert isinstance(result, Failure)
         assert result.failure() == upstream_error
@@ -1,54 +1,103 @@
 """Tests for label-based data routing in pipeline."""
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import Any
+
+import pytest
+from returns.result import Failure, Result, Success
+
+from cryoflow_core.pipeline import (
+    LabeledDataMap,
+    _execute_labeled_output,
+    _execute_labeled_transform_chain,
+    run_pipeline,
+)
+from cryoflow_core.plugin import FrameData
+
+from ..conftest import (
+    UNUSED_CONFIG_DIR,
+    DummyInputPlugin,
+    DummyOutputPlugin,
+    DummyTransformPlugin,
+    assert_failure_contains,
+)
+
 
-from returns.result import Failure, Success
+class RecordingTransformPlugin(DummyTransformPlugin):
+    """Identity transform that records its id when executed."""
 
-from cryoflow_core.pipeline import LabeledDataMap, _execute_labeled_output, _execute_labeled_transform_chain, run_pipeline
+    def __init__(
+        self,
+        track_id: str,
+        executed: list[str],
+        options: dict[str, Any],
+        config_dir: Path,
+        label: str,
+    ) -> None:
+        super().__init__(options, config_dir, label=label)
+        self._track_id = track_id
+        self._executed = executed
 
-from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
+    def execute(self, df: FrameData) -> Result[FrameData, Exception]:
+        self._executed.append(self._track_id)
+        return Success(df)
+
+
+@pytest.fixture()
+def default_datamap(sample_lazyframe) -> LabeledDataMap:
+    """Return a data map holding the sample LazyFrame under the default label."""
+    return {'default': Success(sample_lazyframe)}
 
 
 class TestLabelRouting:
     """Tests for label-based data routing in pipeline."""
 
-    def test_execute_labeled_transform_chain_matching_label(self, sample_lazyframe, tmp_path: Path) -> None:
-        """Transform plugin with matching label should process data."""
-        plugin = DummyTransformPlugin({}, tmp_path, label='default')
-        data_map: LabeledDataMap = {'default': Success(sample_lazyframe)}
-        result_map = _execute_labeled_transform_chain(data_map, [plugin])
-        assert 'default' in result_map
-        assert isinstance(result_map['default'], Success)
+    @pytest.mark.parametrize(
+        'label,expected',
+        [('default', Success), ('nonexistent', Failure)],
+        ids=['matching_label', 'missing_label'],
+    )
+    def test_execute_labeled_transform_chain(
+        self, default_datamap: LabeledDataMap, label: str, expected: type[Result]
+    ) -> None:
+        """Transform plugin should process matching data, or create a Failure entry for a missing label."""
+        plugin = DummyTransformPlugin({}, UNUSED_CONFIG_DIR, label=label)
+        result_map = _execute_labeled_transform_chain(default_datamap, [plugin])
+        assert label in result_map
+        assert isinstance(result_map[label], expected)
 
-    def test_execute_labeled_transform_chain_missing_label(self, sample_lazyframe, tmp_path: Path) -> None:
-        """Transform plugin with non-existent label should create Failure entry."""
-        plugin = DummyTransformPlugin({}, tmp_path, label='nonexistent')
-        data_map: LabeledDataMap = {'default': Success(sample_lazyframe)}
-        result_map = _execute_labeled_transform_chain(data_map, [plugin])
-        assert 'nonexistent' in result_map
-        assert isinstance(result_map['nonexistent'], Failure)
+    def test_execute_labeled_transform_chain_keeps_order_within_label(self, default_datamap: LabeledDataMap) -> None:
+        """Plugins sharing a label should run in configuration order."""
+        executed: list[str] = []
+        plugins = [
+            RecordingTransformPlugin(track_id, executed, {}, UNUSED_CONFIG_DIR, label='default')
+            for track_id in ('first', 'second', 'third')
+        ]
+        result_map = _execute_labeled_transform_chain(default_datamap, plugins)
+        assert isinstance(result_map['default'], Success)
+        assert executed == ['first', 'second', 'third']
 
-    def test_execute_labeled_output_matching_label(self, sample_lazyframe, tmp_path: Path) -> None:
+    def test_execute_labeled_output_matching_label(self, default_datamap: LabeledDataMap) -> None:
         """Output plugin with matching label should succeed."""
-        plugin = DummyOutputPlugin({}, tmp_path, label='default')
-        data_map: LabeledDataMap = {'default': Success(sample_lazyframe)}
-        result = _execute_labeled_output(data_map, [plugin])
+        plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR, label='default')
+        result = _execute_labeled_output(default_datamap, [plugin])
         assert isinstance(result, Success)
 
-    def test_execute_labeled_output_missing_label(self, sample_lazyframe, tmp_path: Path) -> None:
-        """Output plugin with non-existent label should fail."""
-        plugin = DummyOutputPlugin({}, tmp_path, label='nonexistent')
-        data_map: LabeledDataMap = {'default': Success(sample_lazyframe)}
-        result = _execute_labeled_output(data_map, [plugin])
-        assert isinstance(result, Failure)
-        assert 'nonexistent' in str(result.failure())
+    @pytest.mark.parametrize('label', ['nonexistent', 'Default'], ids=['missing_label', 'case_mismatch'])
+    def test_execute_labeled_output_missing_label(self, default_datamap: LabeledDataMap, label: str) -> None:
+        """Output plugin whose label has no data should fail naming that label."""
+        plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR, label=label)
+        result = _execute_labeled_output(default_datamap, [plugin])
+        assert_failure_contains(result, label)
 
-    def test_multiple_labels_routing(self, tmp_path: Path) -> None:
+    def test_multiple_labels_routing(self) -> None:
         """Test that multiple labeled data streams are processed independently."""
-        input_a = DummyInputPlugin({}, tmp_path, label='stream_a')
-        input_b = DummyInputPlugin({}, tmp_path, label='stream_b')
-        output_a = DummyOutputPlugin({}, tmp_path, label='stream_a')
-        output_b = DummyOutputPlugin({}, tmp_path, label='stream_b')
+        input_a = DummyInputPlugin({}, UNUSED_CONFIG_DIR, label='stream_a')
+        input_b = DummyInputPlugin({}, UNUSED_CONFIG_DIR, label='stream_b')
+        output_a = DummyOutputPlugin({}, UNUSED_CONFIG_DIR, label='stream_a')
+        output_b = DummyOutputPlugin({}, UNUSED_CONFIG_DIR, label='stream_b')
 
         result = run_pipeline([input_a, input_b], [], [output_a, output_b])
         assert isinstance(result, Success)
@@ -1,24 +1,31 @@
 """Tests for run_dry_run_pipeline function."""
 
-from pathlib import Path
+from unittest.mock import patch
 
-import polars as pl
 from returns.result import Failure, Success
 
 from cryoflow_core.pipeline import run_dry_run_pipeline
-from cryoflow_core.plugin import FrameData, InputPlugin, OutputPlugin, TransformPlugin
 
-from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
+from ..conftest import (
+    UNUSED_CONFIG_DIR,
+    DummyInputPlugin,
+    DummyOutputPlugin,
+    DummyTransformPlugin,
+    FailingInputPlugin,
+    FailingOutputPlugin,
+    FailingTransformPlugin,
+    assert_failure_contains,
+)
 
 
 class TestRunDryRunPipeline:
     """Tests for complete dry-run pipeline execution using InputPlugin."""
 
-    def test_dry_run_pipeline_success(self, tmp_path: Path) -> None:
+    def test_dry_run_pipeline_success(self) -> None:
         """Test successful dry-run pipeline with DummyInputPlugin."""
-        input_plugin = DummyInputPlugin({}, tmp_path)
-        transform_plugin = DummyTransformPlugin({}, tmp_path)
-        output_plugin = DummyOutputPlugin({}, tmp_path)
+        input_plugin = DummyInputPlugin({}, UNUSED_CONFIG_DIR)
+        transform_plugin = DummyTransformPlugin({}, UNUSED_CONFIG_DIR)
+        output_plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
 
         result = run_dry_run_pipeline([input_plugin], [transform_plugin], [output_plugin])
 
@@ -27,69 +34,68 @@ class TestRunDryRunPipeline:
         assert 'a' in schema
         assert 'b' in schema
 
-    def test_dry_run_pipeline_input_failure(self, tmp_path: Path) -> None:
+    def test_dry_run_pipeline_input_failure(self) -> None:
         """Test dry-run when input dry_run fails."""
-        from returns.result import Failure as FailureResult
-
-        class FailingInputPlugin(InputPlugin):
-            def name(self) -> str:
-                return 'failing_input'
-
-            def execute(self) -> FailureResult[Exception]:
-                return FailureResult(FileNotFoundError('file not found'))
-
-            def dry_run(self) -> FailureResult[Exception]:
-                return FailureResult(FileNotFoundError('file not found'))
-
-        input_plugin = FailingInputPlugin({}, tmp_path)
-        output_plugin = DummyOutputPlugin({}, tmp_path)
+        input_plugin = FailingInputPlugin({}, UNUSED_CONFIG_DIR)
+        output_plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
 
         result = run_dry_run_pipeline([input_plugin], [], [output_plugin])
 
         assert isinstance(result, Failure)
         assert isinstance(result.failure(), FileNotFoundError)
 
-    def test_dry_run_pipeline_transform_validation_fails(self, tmp_path: Path) -> None:
+    def test_dry_run_pipeline_transform_validation_fails(self) -> None:
         """Test dry-run when transform validation fails."""
-        from returns.result import Failure as FailureResult
+        input_plugin = DummyInputPlugin({}, UNUSED_CONFIG_DIR)
+        transform_plugin = FailingTransformPlugin(
+            {'dry_run_error': "Column 'missing_col' not found"}, UNUSED_CONFIG_DIR
+        )
+        output_plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
 
-        class FailingTransformPlugin(TransformPlugin):
-            def name(self) -> str:
-                return 'failing_transform'
+        result = run_dry_run_pipeline([input_plugin], [transform_plugin], [output_plugin])
 
-            def execute(self, df: FrameData) -> FailureResult[Exception]:
-                return FailureResult(ValueError('execution error'))
+        assert_failure_contains(result, 'missing_col')
 
-            def dry_run(self, schema: dict[str, pl.DataType]) -> FailureResult[Exception]:
-                return FailureResult(ValueError("Column 'missing_col' not found"))
+    def test_dry_run_pipeline_output_validation_fails(self) -> None:
+        """Test dry-run when output validation fails."""
+        input_plugin = DummyInputPlugin({}, UNUSED_CONFIG_DIR)
+        output_plugin = FailingOutputPlugin({'dry_run_error': 'Invalid output format'}, UNUSED_CONFIG_DIR)
 
-        input_plugin = DummyInputPlugin({}, tmp_path)
-        transform_plugin = FailingTransformPlugin({}, tmp_path)
-        output_plugin = DummyOutputPlugin({}, tmp_path)
+        result = run_dry_run_pipeline([input_plugin], [], [output_plugin])
 
-        result = run_dry_run_pipeline([input_plugin], [transform_plugin], [output_plugin])
+        assert_failure_contains(result, 'Invalid output format')
 
-        assert isinstance(result, Failure)
-        assert 'missing_col' in str(result.failure())
+    def test_dry_run_pipeline_skips_non_default_inputs(self) -> None:
+        """Test that inputs outside the default label are not dry-run (their schema would be unused)."""
+        other_input = FailingInputPlugin({}, UNUSED_CONFIG_DIR, label='other')
+        input_plugin = DummyInputPlugin({}, UNUSED_CONFIG_DIR)
+        output_plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
 
-    def test_dry_run_pipeline_output_validation_fails(self, tmp_path: Path) -> None:
-        """Test dry-run when output validation fails."""
-        from returns.result import Failure as FailureResult, Success as SuccessResult
+        with patch.object(other_input, 'dry_run') as other_dry_run:
+            result = run_dry_run_pipeline([other_input, input_plugin], [], [output_plugin])
 
-        class FailingOutputPlugin(OutputPlugin):
-            def name(self) -> str:
-                return 'failing_output'
+        assert isinstance(result, Success)
+        other_dry_run.assert_not_called()
 
-            def execute(self, df: FrameData) -> SuccessResult[None]:
-                return SuccessResult(None)
+    def test_dry_run_pipeline_no_default_input(self) -> None:
+        """Test dry-run fails without evaluating any plugin when no input has the default label."""
+        input_plugin = DummyInputPlugin({}, UNUSED_CONFIG_DIR, label='other')
+        output_plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
 
-            def dry_run(self, schema: dict[str, pl.DataType]) -> FailureResult[Exception]:
-                return FailureResult(ValueError('Invalid output format'))
+        with patch.object(output_plugin, 'dry_run') as output_dry_run:
+            result = run_dry_run_pipeline([input_plugin], [], [output_plugin])
 
-        input_plugin = DummyInputPlugin({}, tmp_path)
-        output_plugin = FailingOutputPlugin({}, tmp_path)
+        assert_failure_contains(result, 'default')
+        output_dry_run.assert_not_called()
 
-        result = run_dry_run_pipeline([input_plugin], [], [output_plugin])
+    def test_dry_run_pipeline_transform_failure_skips_output(self) -> None:
+        """Test that output validation is not evaluated once a transform has failed."""
+        input_plugin = DummyInputPlugin({}, UNUSED_CONFIG_DIR)
+        transform_plugin = FailingTransformPlugin({}, UNUSED_CONFIG_DIR)
+        output_plugin = DummyOutputPlugin({}, UNUSED_CONFIG_DIR)
+
+        with patch.object(output_plugin, 'dry_run') as output_dry_run:
+            result = run_dry_run_pipeline([input_plugin], [transform_plugin], [output_plugin])
 
         assert isinstance(result, Failure)
-        assert 'Invalid output format' in str(result.failure())
+        output_dry_run.assert_not_called()
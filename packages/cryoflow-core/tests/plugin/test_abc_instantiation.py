@@ -8,21 +8,10 @@ from cryoflow_core.plugin import BasePlugin, InputPlugin, OutputPlugin, Transfor
 
 
 class TestABCInstantiation:
-    def test_base_plugin_not_instantiable(self):
+    @pytest.mark.parametrize('cls', [BasePlugin, InputPlugin, TransformPlugin, OutputPlugin])
+    def test_not_instantiable(self, cls: type[BasePlugin]):
         with pytest.raises(TypeError):
-            BasePlugin({})  # type: ignore[abstract]
-
-    def test_input_plugin_not_instantiable(self):
-        with pytest.raises(TypeError):
-            InputPlugin({})  # type: ignore[abstract]
-
-    def test_transform_plugin_not_instantiable(self):
-        with pytest.raises(TypeError):
-            TransformPlugin({})  # type: ignore[abstract]
-
-    def test_output_plugin_not_instantiable(self):
-        with pytest.raises(TypeError):
-            OutputPlugin({})  # type: ignore[abstract]
+            cls({})  # type: ignore[abstract]
 
     def test_partial_implementation_raises(self, tmp_path: Path):
         """Only implementing name() should still raise TypeError."""
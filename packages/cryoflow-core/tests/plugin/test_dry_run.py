@@ -1,7 +1,5 @@
 """Tests for plugin dry_run methods."""
 
-from pathlib import Path
-
 import polars as pl
 from returns.result import Failure, Success
 
@@ -9,21 +7,18 @@ from ..conftest import DummyOutputPlugin, DummyTransformPlugin, FailingTransform
 
 
 class TestDryRun:
-    def test_transform_dry_run_success(self, tmp_path: Path):
-        p = DummyTransformPlugin({}, tmp_path)
+    def test_transform_dry_run_success(self, dummy_transform: DummyTransformPlugin):
         schema = {'a': pl.Int64(), 'b': pl.Utf8()}
-        result = p.dry_run(schema)
+        result = dummy_transform.dry_run(schema)
         assert isinstance(result, Success)
         assert result.unwrap() == schema
 
-    def test_transform_dry_run_failure(self, tmp_path: Path):
-        p = FailingTransformPlugin({}, tmp_path)
+    def test_transform_dry_run_failure(self, failing_transform: FailingTransformPlugin):
         schema: dict[str, pl.DataType] = {'a': pl.Int64()}
-        result = p.dry_run(schema)
+        result = failing_transform.dry_run(schema)
         assert isinstance(result, Failure)
 
-    def test_output_dry_run_success(self, tmp_path: Path):
-        p = DummyOutputPlugin({}, tmp_path)
+    def test_output_dry_run_success(self, dummy_output: DummyOutputPlugin):
         schema: dict[str, pl.DataType] = {'a': pl.Int64()}
-        result = p.dry_run(schema)
+        result = dummy_output.dry_run(schema)
         assert isinstance(result, Success)
@@ -1,40 +1,41 @@
 """Tests for plugin inheritance relationships."""
 
-from pathlib import Path
-
+import pytest
 from cryoflow_core.plugin import BasePlugin, InputPlugin, OutputPlugin, TransformPlugin
 
-from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
+from ..conftest import UNUSED_CONFIG_DIR, DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
 
 
 class TestInheritance:
-    def test_input_is_base(self):
-        assert issubclass(InputPlugin, BasePlugin)
-
-    def test_transform_is_base(self):
-        assert issubclass(TransformPlugin, BasePlugin)
-
-    def test_output_is_base(self):
-        assert issubclass(OutputPlugin, BasePlugin)
-
-    def test_dummy_input_is_input(self):
-        assert issubclass(DummyInputPlugin, InputPlugin)
-
-    def test_dummy_transform_is_transform(self):
-        assert issubclass(DummyTransformPlugin, TransformPlugin)
-
-    def test_dummy_output_is_output(self):
-        assert issubclass(DummyOutputPlugin, OutputPlugin)
-
-    def test_isinstance_check_input(self, tmp_path: Path):
-        p = DummyInputPlugin({}, tmp_path)
-        assert isinstance(p, BasePlugin)
-        assert isinstance(p, InputPlugin)
-        assert not isinstance(p, TransformPlugin)
-        assert not isinstance(p, OutputPlugin)
-
-    def test_isinstance_check_transform(self, tmp_path: Path):
-        p = DummyTransformPlugin({}, tmp_path)
+    @pytest.mark.parametrize(
+        'sub,base',
+        [
+            (InputPlugin, BasePlugin),
+            (TransformPlugin, BasePlugin),
+            (OutputPlugin, BasePlugin),
+            (DummyInputPlugin, InputPlugin),
+            (DummyTransformPlugin, TransformPlugin),
+            (DummyOutputPlugin, OutputPlugin),
+        ],
+    )
+    def test_issubclass(self, sub: type[BasePlugin], base: type[BasePlugin]):
+        assert issubclass(sub, base)
+
+    @pytest.mark.parametrize(
+        'plugin_cls,base,other_bases',
+        [
+            (DummyInputPlugin, InputPlugin, (TransformPlugin, OutputPlugin)),
+            (DummyTransformPlugin, TransformPlugin, (OutputPlugin,)),
+        ],
+        ids=['input', 'transform'],
+    )
+    def test_isinstance_check(
+        self,
+        plugin_cls: type[BasePlugin],
+        base: type[BasePlugin],
+        other_bases: tuple[type[BasePlugin], ...],
+    ):
+        p = plugin_cls({}, UNUSED_CONFIG_DIR)
         assert isinstance(p, BasePlugin)
-        assert isinstance(p, TransformPlugin)
-        assert not isinstance(p, OutputPlugin)
+        assert isinstance(p, base)
+        assert not isinstance(p, other_bases)
@@ -1,7 +1,5 @@
 """Tests for InputPlugin execute and dry_run."""
 
-from pathlib import Path
-
 import polars as pl
 from returns.result import Success
 
@@ -9,15 +7,13 @@ from ..conftest import DummyInputPlugin
 
 
 class TestInputPluginExecute:
-    def test_input_execute_returns_lazyframe(self, tmp_path: Path):
-        p = DummyInputPlugin({}, tmp_path)
-        result = p.execute()
+    def test_input_execute_returns_lazyframe(self, dummy_input: DummyInputPlugin):
+        result = dummy_input.execute()
         assert isinstance(result, Success)
         assert isinstance(result.unwrap(), pl.LazyFrame)
 
-    def test_input_dry_run_returns_schema(self, tmp_path: Path):
-        p = DummyInputPlugin({}, tmp_path)
-        result = p.dry_run()
+    def test_input_dry_run_returns_schema(self, dummy_input: DummyInputPlugin):
+        result = dummy_input.dry_run()
         assert isinstance(result, Success)
         schema = result.unwrap()
         assert 'a' in schema
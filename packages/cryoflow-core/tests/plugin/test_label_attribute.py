@@ -1,29 +1,25 @@
 """Tests for plugin label attribute."""
 
-from pathlib import Path
-
-from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
+from ..conftest import UNUSED_CONFIG_DIR, DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
 from cryoflow_core.plugin import DEFAULT_LABEL
 
 
 class TestLabelAttribute:
-    def test_default_label(self, tmp_path: Path):
-        p = DummyTransformPlugin({}, tmp_path)
-        assert p.label == DEFAULT_LABEL
-        assert p.label == 'default'
+    def test_default_label(self, dummy_transform: DummyTransformPlugin):
+        assert dummy_transform.label == DEFAULT_LABEL
+        assert dummy_transform.label == 'default'
 
-    def test_custom_label(self, tmp_path: Path):
-        p = DummyTransformPlugin({}, tmp_path, label='sales')
+    def test_custom_label(self):
+        p = DummyTransformPlugin({}, UNUSED_CONFIG_DIR, label='sales')
         assert p.label == 'sales'
 
-    def test_input_plugin_default_label(self, tmp_path: Path):
-        p = DummyInputPlugin({}, tmp_path)
-        assert p.label == 'default'
+    def test_input_plugin_default_label(self, dummy_input: DummyInputPlugin):
+        assert dummy_input.label == 'default'
 
-    def test_input_plugin_custom_label(self, tmp_path: Path):
-        p = DummyInputPlugin({}, tmp_path, label='orders')
+    def test_input_plugin_custom_label(self):
+        p = DummyInputPlugin({}, UNUSED_CONFIG_DIR, label='orders')
         assert p.label == 'orders'
 
-    def test_output_plugin_label(self, tmp_path: Path):
-        p = DummyOutputPlugin({}, tmp_path, label='results')
+    def test_output_plugin_label(self):
+        p = DummyOutputPlugin({}, UNUSED_CONFIG_DIR, label='results')
         assert p.label == 'results'
@@ -1,26 +1,23 @@
 """Tests for plugin options storage."""
 
-from pathlib import Path
-
-from ..conftest import DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
+from ..conftest import UNUSED_CONFIG_DIR, DummyInputPlugin, DummyOutputPlugin, DummyTransformPlugin
 
 
 class TestOptionsStorage:
-    def test_input_plugin_stores_options(self, tmp_path: Path):
+    def test_input_plugin_stores_options(self):
         opts = {'input_path': 'data.parquet'}
-        p = DummyInputPlugin(opts, tmp_path)
+        p = DummyInputPlugin(opts, UNUSED_CONFIG_DIR)
         assert p.options is opts
 
-    def test_transform_plugin_stores_options(self, tmp_path: Path):
+    def test_transform_plugin_stores_options(self):
         opts = {'threshold': 10}
-        p = DummyTransformPlugin(opts, tmp_path)
+        p = DummyTransformPlugin(opts, UNUSED_CONFIG_DIR)
         assert p.options is opts
 
-    def test_output_plugin_stores_options(self, tmp_path: Path):
+    def test_output_plugin_stores_options(self):
         opts = {'format': 'csv'}
-        p = DummyOutputPlugin(opts, tmp_path)
+        p = DummyOutputPlugin(opts, UNUSED_CONFIG_DIR)
         assert p.options is opts
 
-    def test_empty_options(self, tmp_path: Path):
-        p = DummyTransformPlugin({}, tmp_path)
-        assert p.options == {}
+    def test_empty_options(self, dummy_transform: DummyTransformPlugin):
+        assert dummy_transform.options == {}
@@ -2,49 +2,46 @@
 
 from pathlib import Path
 
+import pytest
+
 from ..conftest import DummyInputPlugin, DummyTransformPlugin
 
 
+@pytest.fixture(scope='module')
+def config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the config directory once for all path resolution tests in this module."""
+    return tmp_path_factory.mktemp('config')
+
+
+@pytest.fixture(scope='module')
+def path_plugin(config_dir: Path) -> DummyTransformPlugin:
+    """Return a transform plugin anchored at config_dir (resolve_path does not mutate it)."""
+    return DummyTransformPlugin({}, config_dir)
+
+
 class TestPathResolution:
-    def test_resolve_path_relative(self, tmp_path: Path):
+    def test_resolve_path_relative(self, config_dir: Path, path_plugin: DummyTransformPlugin):
         """Test that relative paths are resolved relative to config_dir."""
-        config_dir = tmp_path / 'config'
-        config_dir.mkdir()
-        p = DummyTransformPlugin({}, config_dir)
-        result = p.resolve_path('data/output.parquet')
-        expected = (config_dir / 'data' / 'output.parquet').resolve()
-        assert result == expected
-
-    def test_resolve_path_absolute(self, tmp_path: Path):
+        result = path_plugin.resolve_path('data/output.parquet')
+        assert result == (config_dir / 'data' / 'output.parquet').resolve()
+
+    def test_resolve_path_absolute(self, path_plugin: DummyTransformPlugin):
         """Test that absolute paths are preserved (after normalization)."""
-        config_dir = tmp_path / 'config'
-        config_dir.mkdir()
-        p = DummyTransformPlugin({}, config_dir)
         absolute_path = Path('/absolute/path/to/file.parquet')
-        result = p.resolve_path(absolute_path)
-        assert result == absolute_path.resolve()
+        assert path_plugin.resolve_path(absolute_path) == absolute_path.resolve()
 
-    def test_resolve_path_string_input(self, tmp_path: Path):
+    def test_resolve_path_string_input(self, config_dir: Path, path_plugin: DummyTransformPlugin):
         """Test that string paths work correctly."""
-        config_dir = tmp_path / 'config'
-        config_dir.mkdir()
-        p = DummyTransformPlugin({}, config_dir)
-        result = p.resolve_path('relative/path.txt')
-        expected = (config_dir / 'relative' / 'path.txt').resolve()
-        assert result == expected
-
-    def test_resolve_path_path_input(self, tmp_path: Path):
+        result = path_plugin.resolve_path('relative/path.txt')
+        assert result == (config_dir / 'relative' / 'path.txt').resolve()
+
+    def test_resolve_path_path_input(self, config_dir: Path, path_plugin: DummyTransformPlugin):
         """Test that Path objects work correctly."""
-        config_dir = tmp_path / 'config'
-        config_dir.mkdir()
-        p = DummyTransformPlugin({}, config_dir)
-        result = p.resolve_path(Path('relative/path.txt'))
-        expected = (config_dir / 'relative' / 'path.txt').resolve()
-        assert result == expected
-
-    def test_input_plugin_resolve_path(self, tmp_path: Path):
+        result = path_plugin.resolve_path(Path('relative/path.txt'))
+        assert result == (config_dir / 'relative' / 'path.txt').resolve()
+
+    def test_input_plugin_resolve_path(self, config_dir: Path):
         """Test that InputPlugin can also resolve paths."""
-        p = DummyInputPlugin({}, tmp_path)
+        p = DummyInputPlugin({}, config_dir)
         result = p.resolve_path('data/file.parquet')
-        expected = (tmp_path / 'data' / 'file.parquet').resolve()
-        assert result == expected
+        assert result == (config_dir / 'data' / 'file.parquet').resolve()